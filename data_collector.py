@@ -6,15 +6,48 @@ Collects and aggregates data from various sources for the Clawdbot dashboard.
 Outputs to JSON format for easy web frontend consumption.
 """
 
+import hashlib
+import heapq
 import json
+import mmap
 import os
 import re
+import shlex
 import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# The frontend parses with JSON.parse and ignores whitespace, so emit
+# compact output by default; set DASHBOARD_PRETTY=1 for human-readable
+# state files when debugging.
+_PRETTY = os.environ.get("DASHBOARD_PRETTY") == "1"
+
+# Use orjson for JSON encode/decode when available (C extension, ~5x
+# faster than stdlib on these payloads); fall back to stdlib json.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(data) -> bytes:
+        opt = orjson.OPT_INDENT_2 if _PRETTY else 0
+        return orjson.dumps(data, option=opt, default=str)
+
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(data) -> bytes:
+        if _PRETTY:
+            return json.dumps(data, indent=2, default=str).encode()
+        return json.dumps(data, separators=(',', ':'), default=str).encode()
+
 # Configuration
 CONFIG = {
     "update_interval": 10,  # seconds
@@ -38,45 +71,162 @@ PROJECT_REPOS = [
 SUCCESS_LOG_FILE = '/home/chris/clawd/dashboard/agent_success_log.jsonl'
 IDLE_TIMEOUT_MINUTES = 30
 
+# blake2b digest of the last-written output file, for skipping
+# writes when nothing changed
+_last_output_hash = None
+
+# Separator line between the batched git sub-command outputs
+_GIT_SECTION_SEP = '=====GIT-SECTION====='
+
+# Single pass over a git shortstat line; kind is 'file'/'insertion'/'deletion'
+_STAT_RE = re.compile(r'(\d+)\s+(file|insertion|deletion)')
+
+# git status --porcelain code -> human-readable description
+_STATUS_DESC = {
+    'M': 'modified', 'A': 'added', 'D': 'deleted',
+    'R': 'renamed', 'C': 'copied', 'U': 'updated', '??': 'untracked'
+}
+
+# Summary/Notes heading in a memory file, matched on raw bytes
+_SUMMARY_RE = re.compile(rb'(?:Summary|Notes):?\s*\n([^\n#]+)', re.IGNORECASE)
+
+# Previous (idle, total) jiffies from /proc/stat for delta CPU sampling
+_PREV_CPU: tuple[int, int] | None = None
+
+# Markdown task checkbox, matched on raw bytes so open/done counts come
+# from a single pass over the file instead of repeated lower()+count()
+_TASK_RE = re.compile(rb'-\s\[([ xX])\]')
+
+# Memory-file parse cache: path -> (mtime, size, parsed file_data).
+# Skips re-reading files that haven't changed between ticks.
+_MEM_CACHE: dict[str, tuple[float, int, dict]] = {}
+
+# Incremental log-read state: path -> {"ino": ..., "offset": ..., plus
+# the aggregate derived from everything read so far}. Lets each tick
+# parse only lines appended since the previous read instead of
+# rescanning the whole file.
+_LOG_STATE: dict[str, dict[str, Any]] = {}
+
+# Persistent fds for /proc files; pseudo-files always read fresh content
+# from offset 0, so one open per process is enough.
+_PROC_FDS: dict[str, int] = {}
+
+
+def _read_proc(path: str) -> bytes:
+    """Read a /proc file via a cached fd, avoiding open/close every tick."""
+    fd = _PROC_FDS.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _PROC_FDS[path] = fd
+    return os.pread(fd, 65536, 0)
+
 
 def get_timestamp() -> str:
     """Get current UTC timestamp in ISO format."""
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=4096)
+def _iso_from_millis(ms: int) -> str:
+    """Format an epoch-milliseconds timestamp as ISO 8601 UTC (memoized)."""
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _iso_from_seconds(ts: float) -> str:
+    """Format an epoch-seconds timestamp as ISO 8601 UTC (memoized)."""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _read_log_tail(path: str, offset: int) -> tuple[list[bytes], int]:
+    """Return complete lines appended since offset, plus the new offset.
+
+    The file is mmapped and split on newlines directly in the buffer,
+    which avoids Python-level readline overhead. A trailing partial line
+    (still being written) is left for the next call.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= offset:
+            return [], offset
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            lines = []
+            start = offset
+            n = len(mm)
+            while start < n:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    break
+                if end > start:
+                    lines.append(mm[start:end])
+                start = end + 1
+            return lines, start
+        finally:
+            mm.close()
+
+
 def get_paused_agents() -> set:
-    """Read control log to determine which agents are currently paused."""
-    paused = set()
+    """Read control log to determine which agents are currently paused.
+
+    Only the bytes appended since the last call are parsed; the derived
+    paused set is cached in _LOG_STATE. A changed inode or shrunken file
+    (rotation/truncation) triggers a full rescan.
+    """
     control_log_file = CONFIG.get("control_log_file")
-    
+
     if not control_log_file or not os.path.exists(control_log_file):
-        return paused
-    
+        return set()
+
     try:
-        with open(control_log_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    if entry.get('success'):
-                        action = entry.get('action')
-                        session_key = entry.get('session_key')
-                        if action == 'pause' and session_key:
-                            paused.add(session_key)
-                        elif action in ('resume', 'kill') and session_key:
-                            paused.discard(session_key)
-                except json.JSONDecodeError:
-                    continue
+        st = os.stat(control_log_file)
+        state = _LOG_STATE.get(control_log_file)
+
+        if state and state["ino"] == st.st_ino and st.st_size >= state["offset"]:
+            if st.st_size == state["offset"]:
+                # Nothing new since last read
+                return set(state["paused"])
+            paused = state["paused"]
+            offset = state["offset"]
+        else:
+            # First read, or the file was rotated/truncated
+            paused = set()
+            offset = 0
+
+        lines, offset = _read_log_tail(control_log_file, offset)
+        for line in lines:
+            try:
+                entry = _loads(line)
+                if entry.get('success'):
+                    action = entry.get('action')
+                    session_key = entry.get('session_key')
+                    if action == 'pause' and session_key:
+                        paused.add(session_key)
+                    elif action in ('resume', 'kill') and session_key:
+                        paused.discard(session_key)
+            except ValueError:
+                continue
+
+        _LOG_STATE[control_log_file] = {
+            "ino": st.st_ino,
+            "offset": offset,
+            "paused": paused,
+        }
+        return set(paused)
     except Exception as e:
         print(f"[{get_timestamp()}] Error reading control log: {e}")
-    
-    return paused
+        return set()
+
+
+# Parsed sessions cache: ((ino, mtime_ns, size), sessions, total_tokens,
+# by_key). sessions.json rarely changes between ticks, so the rebuilt
+# list is reused until the file's stat signature moves.
+_SESSIONS_CACHE: tuple[tuple, list[dict], int, dict[str, dict]] | None = None
 
 
 def read_sessions() -> dict[str, Any]:
     """Read active sessions from sessions.json."""
+    global _SESSIONS_CACHE
     sessions_data = {
         "timestamp": get_timestamp(),
         "active_sessions": [],
@@ -84,22 +234,37 @@ def read_sessions() -> dict[str, Any]:
         "total_tokens": 0,
         "errors": []
     }
-    
+
     # Get paused agents status
     paused_agents = get_paused_agents()
     sessions_data["paused_agents"] = list(paused_agents)
-    
+
     try:
         if not os.path.exists(CONFIG["sessions_file"]):
             sessions_data["errors"].append("Sessions file not found")
             return sessions_data
-        
-        with open(CONFIG["sessions_file"], 'r') as f:
-            data = json.load(f)
-        
+
+        st = os.stat(CONFIG["sessions_file"])
+        stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if _SESSIONS_CACHE and _SESSIONS_CACHE[0] == stat_key:
+            # Unchanged file: reuse the parsed sessions, refreshing only
+            # the paused flags (the control log moves independently).
+            sessions, total_tokens, by_key = _SESSIONS_CACHE[1:]
+            for session_data in sessions:
+                session_data["paused"] = session_data["session_key"] in paused_agents
+            sessions_data["active_sessions"] = sessions
+            sessions_data["total_sessions"] = len(sessions)
+            sessions_data["total_tokens"] = total_tokens
+            sessions_data["by_key"] = by_key
+            return sessions_data
+
+        with open(CONFIG["sessions_file"], 'rb') as f:
+            data = _loads(f.read())
+
         sessions = []
+        by_key = {}
         total_tokens = 0
-        
+
         for session_key, session_info in data.items():
             session_data = {
                 "session_key": session_key,
@@ -114,10 +279,9 @@ def read_sessions() -> dict[str, Any]:
                 "output_tokens": session_info.get("outputTokens", 0),
                 "context_tokens": session_info.get("contextTokens", 200000),
                 "compaction_count": session_info.get("compactionCount", 0),
-                "last_updated": datetime.fromtimestamp(
-                    session_info.get("updatedAt", 0) / 1000, 
-                    timezone.utc
-                ).isoformat() if session_info.get("updatedAt") else None,
+                "last_updated": _iso_from_millis(
+                    session_info["updatedAt"]
+                ) if session_info.get("updatedAt") else None,
                 "paused": session_key in paused_agents,
             }
             
@@ -130,13 +294,16 @@ def read_sessions() -> dict[str, Any]:
                 session_data["context_usage_percent"] = 0
             
             sessions.append(session_data)
+            by_key[session_key] = session_data
             total_tokens += session_data["total_tokens"]
         
         sessions_data["active_sessions"] = sessions
         sessions_data["total_sessions"] = len(sessions)
         sessions_data["total_tokens"] = total_tokens
-        
-    except json.JSONDecodeError as e:
+        sessions_data["by_key"] = by_key
+        _SESSIONS_CACHE = (stat_key, sessions, total_tokens, by_key)
+
+    except ValueError as e:
         sessions_data["errors"].append(f"Invalid JSON in sessions file: {str(e)}")
     except Exception as e:
         sessions_data["errors"].append(f"Error reading sessions: {str(e)}")
@@ -163,74 +330,115 @@ def parse_memory_files() -> dict[str, Any]:
             memory_data["errors"].append("Memory directory not found")
             return memory_data
         
-        # Get all .md files in memory directory
+        # Get all .md files in memory directory. scandir reuses the stat
+        # info the kernel already returned with the directory listing, so
+        # there's no extra stat syscall per file.
         memory_files = []
-        for f in os.listdir(CONFIG["memory_dir"]):
-            if f.endswith('.md'):
-                filepath = os.path.join(CONFIG["memory_dir"], f)
+        with os.scandir(CONFIG["memory_dir"]) as it:
+            for entry in it:
+                if not entry.name.endswith('.md'):
+                    continue
                 try:
-                    stat = os.stat(filepath)
+                    stat = entry.stat()
                     memory_files.append({
-                        "filename": f,
-                        "path": filepath,
+                        "filename": entry.name,
+                        "path": entry.path,
                         "modified": stat.st_mtime,
                         "size": stat.st_size
                     })
                 except Exception:
                     continue
         
-        # Sort by modification time (newest first)
-        memory_files.sort(key=lambda x: x["modified"], reverse=True)
+        # Only the newest max_memory_files matter; nlargest is O(N log K)
+        # vs O(N log N) for sorting the whole listing.
         memory_data["total_memory_files"] = len(memory_files)
-        
-        # Parse recent files
+        top_files = heapq.nlargest(
+            CONFIG["max_memory_files"], memory_files, key=lambda x: x["modified"]
+        )
+
+        # Parse recent files. Unchanged files (same mtime and size as the
+        # previous tick) reuse the cached parse result and are not re-read.
         recent_files = []
-        for mem_file in memory_files[:CONFIG["max_memory_files"]]:
+        for mem_file in top_files:
             try:
-                with open(mem_file["path"], 'r') as f:
-                    content = f.read()
-                
+                cached = _MEM_CACHE.get(mem_file["path"])
+                if cached and cached[0] == mem_file["modified"] and cached[1] == mem_file["size"]:
+                    file_data = cached[2]
+                    recent_files.append(file_data)
+                    memory_data["task_summary"]["total_tasks"] += file_data["task_count"]
+                    memory_data["task_summary"]["completed_tasks"] += file_data["completed_count"]
+                    memory_data["task_summary"]["in_progress_tasks"] += (
+                        file_data["task_count"] - file_data["completed_count"]
+                    )
+                    continue
+
+                with open(mem_file["path"], 'rb') as f:
+                    buf = f.read()
+
+                # Count open/done checkboxes in one pass over the raw bytes
+                opens = 0
+                dones = 0
+                for m in _TASK_RE.finditer(buf):
+                    if m.group(1) == b' ':
+                        opens += 1
+                    else:
+                        dones += 1
+
                 file_data = {
                     "filename": mem_file["filename"],
-                    "modified": datetime.fromtimestamp(
-                        mem_file["modified"], timezone.utc
-                    ).isoformat(),
+                    "modified": _iso_from_seconds(mem_file["modified"]),
                     "size_bytes": mem_file["size"],
-                    "task_count": content.lower().count("- [ ]") + content.lower().count("- [x]"),
-                    "completed_count": content.lower().count("- [x]"),
+                    "task_count": opens + dones,
+                    "completed_count": dones,
                     "summary": ""
                 }
-                
-                # Extract summary (first line or first header)
-                lines = content.split('\n')
-                for line in lines[:5]:
-                    if line.startswith('# ') or line.startswith('## '):
-                        file_data["summary"] = line.lstrip('# ').strip()[:100]
+
+                # Extract summary (first line or first header) by walking
+                # the head of the file line by line, without splitting the
+                # whole buffer into a line list
+                head = buf[:2048]
+                first_line = None
+                pos = 0
+                for _ in range(5):
+                    nl = head.find(b'\n', pos)
+                    line = head[pos:nl] if nl != -1 else head[pos:]
+                    if first_line is None:
+                        first_line = line
+                    if line.startswith(b'# ') or line.startswith(b'## '):
+                        file_data["summary"] = line.lstrip(b'# ').strip()[:100].decode('utf-8', 'ignore')
                         break
-                
-                if not file_data["summary"] and lines:
-                    file_data["summary"] = lines[0].strip()[:100]
-                
+                    if nl == -1:
+                        break
+                    pos = nl + 1
+
+                if not file_data["summary"] and first_line is not None:
+                    file_data["summary"] = first_line.strip()[:100].decode('utf-8', 'ignore')
+
                 # Look for "Summary" or "Notes" section
-                summary_match = re.search(r'(?:Summary|Notes):?\s*\n([^\n#]+)', content, re.IGNORECASE)
+                summary_match = _SUMMARY_RE.search(buf)
                 if summary_match:
-                    file_data["summary"] = summary_match.group(1).strip()[:200]
+                    file_data["summary"] = summary_match.group(1).strip()[:200].decode('utf-8', 'ignore')
                 
+                _MEM_CACHE[mem_file["path"]] = (mem_file["modified"], mem_file["size"], file_data)
                 recent_files.append(file_data)
-                
+
                 # Update task counts
                 memory_data["task_summary"]["total_tasks"] += file_data["task_count"]
                 memory_data["task_summary"]["completed_tasks"] += file_data["completed_count"]
                 memory_data["task_summary"]["in_progress_tasks"] += (
                     file_data["task_count"] - file_data["completed_count"]
                 )
-                
+
             except Exception as e:
                 memory_data["errors"].append(f"Error reading {mem_file['filename']}: {str(e)}")
-        
+
+        # Evict cache entries for files that no longer exist
+        current_paths = {m["path"] for m in memory_files}
+        for stale in [p for p in _MEM_CACHE if p not in current_paths]:
+            del _MEM_CACHE[stale]
+
         memory_data["recent_files"] = recent_files
-        memory_data["total_memory_files"] = len(memory_files)
-        
+
     except Exception as e:
         memory_data["errors"].append(f"Error scanning memory directory: {str(e)}")
     
@@ -262,60 +470,62 @@ def get_project_git_activity() -> dict[str, Any]:
             continue
         
         try:
-            # Get current branch
-            result = subprocess.run(
-                ["git", "-C", project["path"], "branch", "--show-current"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                project_data["branch"] = result.stdout.strip()
-            
-            # Get recent commits with file stats
+            # Run all four git queries in a single subprocess instead of
+            # four fork/exec cycles per repo per tick
+            quoted = shlex.quote(project["path"])
+            script = "; echo {}; ".format(_GIT_SECTION_SEP).join([
+                f"git -C {quoted} branch --show-current",
+                f"git -C {quoted} log -10 '--format=%H%x00%h%x00%s%x00%an%x00%at%x00%ar' --stat",
+                f"git -C {quoted} status --porcelain",
+                f"git -C {quoted} rev-list --count HEAD",
+            ])
             result = subprocess.run(
-                [
-                    "git", "-C", project["path"], "log",
-                    "-10",
-                    "--format=%H|%h|%s|%an|%at|%ar",
-                    "--stat"
-                ],
-                capture_output=True, text=True, timeout=5
+                ["sh", "-c", script],
+                capture_output=True, text=True, timeout=10
             )
-            
-            if result.returncode == 0:
+            sections = result.stdout.split(_GIT_SECTION_SEP + '\n')
+            branch_out = sections[0] if len(sections) > 0 else ''
+            log_out = sections[1] if len(sections) > 1 else ''
+            status_out = sections[2] if len(sections) > 2 else ''
+            count_out = sections[3] if len(sections) > 3 else ''
+
+            # Current branch
+            if branch_out.strip():
+                project_data["branch"] = branch_out.strip()
+
+            # Recent commits with file stats
+            if log_out:
                 commits = []
                 current_commit = None
                 
-                for line in result.stdout.strip().split('\n'):
-                    if '|' in line and len(line.split('|')) >= 6 and not line.startswith(' '):
+                for line in log_out.strip().split('\n'):
+                    # Commit lines use NUL separators so '|' in commit
+                    # messages can't break parsing
+                    if line.count('\x00') >= 5:
                         # New commit line
                         if current_commit:
                             commits.append(current_commit)
-                        parts = line.split('|')
+                        parts = line.split('\x00')
                         current_commit = {
                             "hash": parts[0],
                             "short_hash": parts[1],
                             "message": parts[2],
                             "author": parts[3],
-                            "timestamp": datetime.fromtimestamp(
-                                int(parts[4]), timezone.utc
-                            ).isoformat(),
+                            "timestamp": _iso_from_seconds(int(parts[4])),
                             "relative_time": parts[5],
                             "files_changed": 0,
                             "insertions": 0,
                             "deletions": 0
                         }
                     elif current_commit and ('files changed' in line or 'file changed' in line):
-                        # Parse file stats line
-                        files_match = re.search(r'(\d+)\s+files?\s+changed', line)
-                        insertions_match = re.search(r'(\d+)\s+insertions?', line)
-                        deletions_match = re.search(r'(\d+)\s+deletions?', line)
-                        
-                        if files_match:
-                            current_commit["files_changed"] = int(files_match.group(1))
-                        if insertions_match:
-                            current_commit["insertions"] = int(insertions_match.group(1))
-                        if deletions_match:
-                            current_commit["deletions"] = int(deletions_match.group(1))
+                        # Parse the shortstat line in a single scan
+                        for count, kind in _STAT_RE.findall(line):
+                            if kind == 'file':
+                                current_commit["files_changed"] = int(count)
+                            elif kind == 'insertion':
+                                current_commit["insertions"] = int(count)
+                            else:
+                                current_commit["deletions"] = int(count)
                 
                 if current_commit:
                     commits.append(current_commit)
@@ -323,34 +533,22 @@ def get_project_git_activity() -> dict[str, Any]:
                 project_data["commits"] = commits
             
             # Check for uncommitted changes
-            result = subprocess.run(
-                ["git", "-C", project["path"], "status", "--porcelain"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                changes = [c for c in lines if c]
-                project_data["uncommitted_changes"] = len(changes)
-                
-                uncommitted_files = []
-                for line in changes:
-                    status = line[:2].strip()
-                    filename = line[3:].strip()
-                    status_desc = {
-                        'M': 'modified', 'A': 'added', 'D': 'deleted',
-                        'R': 'renamed', 'C': 'copied', 'U': 'updated', '??': 'untracked'
-                    }.get(status, status)
-                    uncommitted_files.append({"filename": filename, "status": status_desc})
-                project_data["uncommitted_files"] = uncommitted_files
-            
+            lines = status_out.strip().split('\n') if status_out.strip() else []
+            changes = [c for c in lines if c]
+            project_data["uncommitted_changes"] = len(changes)
+
+            project_data["uncommitted_files"] = [
+                {
+                    "filename": line[3:].strip(),
+                    "status": _STATUS_DESC.get(line[:2].strip(), line[:2].strip())
+                }
+                for line in changes
+            ]
+
             # Get total commit count
-            result = subprocess.run(
-                ["git", "-C", project["path"], "rev-list", "--count", "HEAD"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                project_data["total_commit_count"] = int(result.stdout.strip())
-                
+            if count_out.strip():
+                project_data["total_commit_count"] = int(count_out.strip())
+
         except Exception as e:
             project_data["error"] = str(e)
         
@@ -359,6 +557,34 @@ def get_project_git_activity() -> dict[str, Any]:
     return git_data
 
 
+# (filesystem, mount_point) for the repo dir, resolved once from
+# /proc/self/mounts; mounts don't change under a running collector
+_MOUNT_INFO: tuple[str, str] | None = None
+
+
+def _get_mount_info(path: str) -> tuple[str, str]:
+    """Find the filesystem and mount point covering path (cached)."""
+    global _MOUNT_INFO
+    if _MOUNT_INFO is None:
+        filesystem, mount_point = "unknown", "unknown"
+        try:
+            best = -1
+            real = os.path.realpath(path)
+            with open('/proc/self/mounts', 'r') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) < 2:
+                        continue
+                    mnt = parts[1]
+                    if (real == mnt or real.startswith(mnt.rstrip('/') + '/')) and len(mnt) > best:
+                        best = len(mnt)
+                        filesystem, mount_point = parts[0], mnt
+        except Exception:
+            pass
+        _MOUNT_INFO = (filesystem, mount_point)
+    return _MOUNT_INFO
+
+
 def get_system_metrics() -> dict[str, Any]:
     """Collect basic system metrics (CPU, memory, disk)."""
     metrics = {
@@ -371,71 +597,50 @@ def get_system_metrics() -> dict[str, Any]:
     
     # Read uptime first for uptime_seconds
     try:
-        with open('/proc/uptime', 'r') as f:
-            uptime_line = f.readline()
-            uptime_seconds = float(uptime_line.split()[0])
-            metrics["uptime_seconds"] = uptime_seconds
+        uptime_seconds = float(_read_proc('/proc/uptime').split()[0])
+        metrics["uptime_seconds"] = uptime_seconds
     except Exception:
         metrics["uptime_seconds"] = 0
-    
+
+    # CPU usage from the /proc/stat delta between ticks. A single
+    # snapshot divides idle by the since-boot totals (a lifetime
+    # average), so the first tick reports 0 and real utilization
+    # appears from the second tick on.
+    global _PREV_CPU
     try:
-        # CPU usage (try multiple methods)
-        cpu_percent = None
-        
-        # Try /proc/stat first
-        try:
-            with open('/proc/stat', 'r') as f:
-                line = f.readline()
-                if line.startswith('cpu '):
-                    fields = list(map(int, line.split()[1:]))
-                    idle = fields[3]
-                    total = sum(fields)
-                    cpu_percent = 100 * (1 - idle / total) if total > 0 else 0
-                    metrics["cpu"]["percent"] = round(cpu_percent, 1)
-        except Exception:
-            pass
-        
-        # Fallback to top command
-        if cpu_percent is None:
-            try:
-                result = subprocess.run(
-                    ["top", "-bn1"],
-                    capture_output=True, text=True, timeout=2
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'Cpu(s)' in line or '%Cpu' in line:
-                            # Parse CPU line
-                            match = re.search(r'(\d+\.?\d*)\s*%?\s*id', line)
-                            if match:
-                                idle = float(match.group(1))
-                                cpu_percent = 100 - idle
-                                metrics["cpu"]["percent"] = round(cpu_percent, 1)
-                                break
-            except Exception:
-                pass
-        
-        if cpu_percent is None:
-            metrics["cpu"]["percent"] = 0
-            
+        line = _read_proc('/proc/stat').split(b'\n', 1)[0]
+        cpu_percent = 0
+        if line.startswith(b'cpu '):
+            fields = list(map(int, line.split()[1:]))
+            idle = fields[3]
+            total = sum(fields)
+            if _PREV_CPU:
+                d_idle = idle - _PREV_CPU[0]
+                d_total = total - _PREV_CPU[1]
+                if d_total > 0:
+                    cpu_percent = 100 * (1 - d_idle / d_total)
+            _PREV_CPU = (idle, total)
+        metrics["cpu"]["percent"] = round(cpu_percent, 1)
     except Exception as e:
+        metrics["cpu"]["percent"] = 0
         metrics["errors"].append(f"Error reading CPU metrics: {str(e)}")
     
     # Memory metrics
     try:
         mem_info = {}
-        with open('/proc/meminfo', 'r') as f:
-            for line in f:
-                if line.startswith('MemTotal:'):
-                    mem_info['total_kb'] = int(line.split()[1])
-                elif line.startswith('MemAvailable:'):
-                    mem_info['available_kb'] = int(line.split()[1])
-                elif line.startswith('MemFree:'):
-                    mem_info['free_kb'] = int(line.split()[1])
-                elif line.startswith('Buffers:'):
-                    mem_info['buffers_kb'] = int(line.split()[1])
-                elif line.startswith('Cached:'):
-                    mem_info['cached_kb'] = int(line.split()[1])
+        wanted = {
+            b'MemTotal:': 'total_kb',
+            b'MemAvailable:': 'available_kb',
+            b'MemFree:': 'free_kb',
+            b'Buffers:': 'buffers_kb',
+            b'Cached:': 'cached_kb',
+        }
+        for line in _read_proc('/proc/meminfo').split(b'\n'):
+            parts = line.split()
+            if len(parts) >= 2:
+                key = wanted.get(parts[0])
+                if key:
+                    mem_info[key] = int(parts[1])
         
         if mem_info:
             total = mem_info.get('total_kb', 0)
@@ -459,30 +664,21 @@ def get_system_metrics() -> dict[str, Any]:
     
     # Disk metrics
     try:
-        result = subprocess.run(
-            ["df", "-k", CONFIG["repo_dir"]],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                if len(parts) >= 6:
-                    total_kb = int(parts[1])
-                    used_kb = int(parts[2])
-                    available_kb = int(parts[3])
-                    percent_used = int(parts[4].rstrip('%'))
-                    
-                    metrics["disk"] = {
-                        "total_gb": round(total_kb / (1024 * 1024), 2),
-                        "used_gb": round(used_kb / (1024 * 1024), 2),
-                        "available_gb": round(available_kb / (1024 * 1024), 2),
-                        "percent_used": percent_used,
-                        "filesystem": parts[0] if len(parts) > 0 else "unknown",
-                        "mount_point": parts[5] if len(parts) > 5 else "unknown"
-                    }
-                    
+        st = os.statvfs(CONFIG["repo_dir"])
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        used = total - free
+
+        filesystem, mount_point = _get_mount_info(CONFIG["repo_dir"])
+        metrics["disk"] = {
+            "total_gb": round(total / (1024 ** 3), 2),
+            "used_gb": round(used / (1024 ** 3), 2),
+            "available_gb": round(free / (1024 ** 3), 2),
+            "percent_used": round(100 * used / total) if total > 0 else 0,
+            "filesystem": filesystem,
+            "mount_point": mount_point
+        }
+
     except Exception as e:
         metrics["errors"].append(f"Error reading disk metrics: {str(e)}")
     
@@ -503,8 +699,8 @@ def get_skills_info() -> dict[str, Any]:
     try:
         # Read from sessions.json to get skills snapshot
         if os.path.exists(CONFIG["sessions_file"]):
-            with open(CONFIG["sessions_file"], 'r') as f:
-                data = json.load(f)
+            with open(CONFIG["sessions_file"], 'rb') as f:
+                data = _loads(f.read())
             
             # Get skills from main session
             main_session = data.get("agent:main:main", {})
@@ -543,45 +739,69 @@ def get_skills_info() -> dict[str, Any]:
 # ==================== Agent Success Tracking ====================
 
 def load_success_history() -> dict[str, Any]:
-    """Load agent success/failure history from log file."""
-    history = {
+    """Load agent success/failure history from log file.
+
+    Rolling counters and the recent-events window are kept in _LOG_STATE
+    so each tick only parses lines appended since the previous read.
+    """
+    empty = {
         "total_completed": 0,
         "total_failed": 0,
         "total_killed": 0,
         "recent_events": []
     }
-    
+
     if not os.path.exists(SUCCESS_LOG_FILE):
-        return history
-    
+        return empty
+
     try:
-        with open(SUCCESS_LOG_FILE, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    event_type = entry.get('event_type')
-                    
-                    if event_type == 'complete':
-                        history["total_completed"] += 1
-                    elif event_type == 'fail':
-                        history["total_failed"] += 1
-                    elif event_type == 'kill':
-                        history["total_killed"] += 1
-                    
-                    # Keep last 50 events
-                    history["recent_events"].append(entry)
-                    if len(history["recent_events"]) > 50:
-                        history["recent_events"].pop(0)
-                        
-                except json.JSONDecodeError:
-                    continue
+        st = os.stat(SUCCESS_LOG_FILE)
+        state = _LOG_STATE.get(SUCCESS_LOG_FILE)
+
+        if state and state["ino"] == st.st_ino and st.st_size >= state["offset"]:
+            history = state["history"]
+            offset = state["offset"]
+            if st.st_size == offset:
+                # Nothing new since last read
+                return {**history, "recent_events": list(history["recent_events"])}
+        else:
+            # First read, or the file was rotated/truncated
+            history = {
+                "total_completed": 0,
+                "total_failed": 0,
+                "total_killed": 0,
+                "recent_events": deque(maxlen=50)
+            }
+            offset = 0
+
+        lines, offset = _read_log_tail(SUCCESS_LOG_FILE, offset)
+        for line in lines:
+            try:
+                entry = _loads(line)
+                event_type = entry.get('event_type')
+
+                if event_type == 'complete':
+                    history["total_completed"] += 1
+                elif event_type == 'fail':
+                    history["total_failed"] += 1
+                elif event_type == 'kill':
+                    history["total_killed"] += 1
+
+                # maxlen=50 discards the oldest event automatically
+                history["recent_events"].append(entry)
+
+            except ValueError:
+                continue
+
+        _LOG_STATE[SUCCESS_LOG_FILE] = {
+            "ino": st.st_ino,
+            "offset": offset,
+            "history": history,
+        }
+        return {**history, "recent_events": list(history["recent_events"])}
     except Exception as e:
         print(f"[{get_timestamp()}] Error loading success history: {e}")
-    
-    return history
+        return empty
 
 
 def log_agent_event(event_type: str, session_key: str, details: dict = None):
@@ -630,26 +850,37 @@ def calculate_success_rate() -> dict[str, Any]:
 
 # ==================== Agent Cleanup ====================
 
+# Done-task session keys from kanban_tasks.json: (mtime_ns, set).
+# Reparsed only when the kanban file's mtime moves.
+_KANBAN_CACHE: tuple[int, set] | None = None
+
+
 def kill_idle_agents(sessions: list) -> list[dict]:
     """Kill agents that have been idle for too long or have completed tasks."""
+    global _KANBAN_CACHE
     killed = []
-    
+
     # Load kanban tasks to check which agents have done tasks
     try:
         kanban_file = '/home/chris/clawd/dashboard/kanban_tasks.json'
         done_session_keys = set()
-        
+
         if os.path.exists(kanban_file):
-            with open(kanban_file, 'r') as f:
-                tasks = json.load(f)
-            
-            for task_id, task in tasks.items():
-                if task.get('status') == 'Done' and task.get('session_key'):
-                    done_session_keys.add(task['session_key'])
+            st = os.stat(kanban_file)
+            if _KANBAN_CACHE and _KANBAN_CACHE[0] == st.st_mtime_ns:
+                done_session_keys = _KANBAN_CACHE[1]
+            else:
+                with open(kanban_file, 'rb') as f:
+                    tasks = _loads(f.read())
+                done_session_keys = {
+                    task['session_key'] for task in tasks.values()
+                    if task.get('status') == 'Done' and task.get('session_key')
+                }
+                _KANBAN_CACHE = (st.st_mtime_ns, done_session_keys)
     except Exception as e:
         print(f"[{get_timestamp()}] Error loading kanban tasks: {e}")
-        tasks = {}
-    
+
+
     for session in sessions:
         session_key = session.get("session_key")
         label = session.get("label", "")
@@ -710,20 +941,43 @@ def kill_agent_session(session_key: str) -> bool:
 
 # ==================== Main Loop ====================
 
-def collect_all_data() -> dict[str, Any]:
-    """Collect all data sources and combine into single structure."""
+def _collect_agent_messages() -> list[dict]:
+    """Collect and return agent messages via the message collector."""
     # Import here to avoid circular dependency issues
-    try:
-        import message_collector
-        # Collect new messages from session files
-        message_collector.collect_messages()
-        # Load current messages for output
-        agent_messages = message_collector.get_messages_for_api()
-    except Exception as e:
-        agent_messages = [{"error": f"Failed to collect messages: {str(e)}"}]
-    
-    # Read sessions first for cleanup
-    sessions_data = read_sessions()
+    import message_collector
+    # Collect new messages from session files
+    message_collector.collect_messages()
+    # Load current messages for output
+    return message_collector.get_messages_for_api()
+
+
+def collect_all_data() -> dict[str, Any]:
+    """Collect all data sources and combine into single structure.
+
+    The collectors are independent and I/O-bound (file reads, subprocess
+    waits), so they run concurrently; wall-clock per tick is the slowest
+    collector rather than the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        f_sessions = executor.submit(read_sessions)
+        f_memory = executor.submit(parse_memory_files)
+        f_git = executor.submit(get_project_git_activity)
+        f_system = executor.submit(get_system_metrics)
+        f_skills = executor.submit(get_skills_info)
+        f_messages = executor.submit(_collect_agent_messages)
+
+        try:
+            agent_messages = f_messages.result()
+        except Exception as e:
+            agent_messages = [{"error": f"Failed to collect messages: {str(e)}"}]
+
+        sessions_data = f_sessions.result()
+        memory_data = f_memory.result()
+        git_data = f_git.result()
+        system_data = f_system.result()
+        skills_data = f_skills.result()
+
+    # Sessions feed the idle-agent cleanup below
     active_sessions = sessions_data.get("active_sessions", [])
     
     # Kill idle agents (with done tasks or idle timeout)
@@ -732,22 +986,21 @@ def collect_all_data() -> dict[str, Any]:
     # Get success rate
     success_rate = calculate_success_rate()
     
-    # Get main session context usage
-    main_context_usage = 0
-    for session in active_sessions:
-        if session.get("session_key") == "agent:main:main":
-            main_context_usage = session.get("context_usage_percent", 0)
-            break
-    
+    # Get main session context usage via the by_key index; the index is
+    # an internal lookup aid and is dropped from the serialized output
+    by_key = sessions_data.pop("by_key", {})
+    main_context_usage = by_key.get("agent:main:main", {}).get("context_usage_percent", 0)
+
+
     data = {
         "timestamp": get_timestamp(),
         "collector_version": "1.0.0",
         "context_usage_percent": main_context_usage,
         "sessions": sessions_data,
-        "memory": parse_memory_files(),
-        "git": get_project_git_activity(),
-        "system": get_system_metrics(),
-        "skills": get_skills_info(),
+        "memory": memory_data,
+        "git": git_data,
+        "system": system_data,
+        "skills": skills_data,
         "messages": agent_messages,
         "success_rate": success_rate,
         "agent_cleanup": {
@@ -760,29 +1013,81 @@ def collect_all_data() -> dict[str, Any]:
     return data
 
 
+def run_collection_cycle():
+    """Collect all data once and write the output state file.
+
+    The file is written to a temp path and renamed into place so readers
+    never see a partially written state file; if the serialized content
+    is identical to the previous cycle the write is skipped entirely.
+    """
+    global _last_output_hash
+    try:
+        data = collect_all_data()
+        buf = _dumps(data)
+
+        digest = hashlib.blake2b(buf, digest_size=16).digest()
+        if digest == _last_output_hash:
+            print(f"[{get_timestamp()}] No changes, skipping write")
+            return
+
+        tmp_path = CONFIG["output_file"] + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(buf)
+        os.replace(tmp_path, CONFIG["output_file"])
+        _last_output_hash = digest
+
+        print(f"[{get_timestamp()}] Data updated successfully")
+
+    except Exception as e:
+        print(f"[{get_timestamp()}] Error: {str(e)}")
+
+
+def _watch_inputs():
+    """Paths whose changes should trigger a collection cycle."""
+    paths = [
+        CONFIG["sessions_file"],
+        CONFIG["sessions_dir"],  # transcripts feeding the message collector
+        CONFIG["memory_dir"],
+        CONFIG["control_log_file"],
+        SUCCESS_LOG_FILE,
+        '/home/chris/clawd/dashboard/kanban_tasks.json',
+        '/home/chris/clawd/dashboard/kanban_tasks.jsonl',
+    ]
+    paths.extend(os.path.join(p["path"], ".git") for p in PROJECT_REPOS)
+    return [p for p in paths if os.path.exists(p)]
+
+
 def main():
     """Main loop - continuously collect and write data."""
     print(f"Clawdbot Dashboard Data Collector v1.0.0")
     print(f"Update interval: {CONFIG['update_interval']} seconds")
     print(f"Output file: {CONFIG['output_file']}")
     print("-" * 50)
-    
-    while True:
-        try:
-            # Collect all data
-            data = collect_all_data()
-            
-            # Write to output file
-            with open(CONFIG["output_file"], 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            print(f"[{get_timestamp()}] Data updated successfully")
-            
-        except Exception as e:
-            print(f"[{get_timestamp()}] Error: {str(e)}")
-        
-        # Wait for next update
-        time.sleep(CONFIG["update_interval"])
+
+    # Prefer filesystem-event wakeups over fixed-interval polling: on a
+    # quiet system the collector then does no work at all, and changes
+    # propagate immediately instead of up to update_interval later.
+    try:
+        from watchfiles import watch
+    except ImportError:
+        watch = None
+
+    run_collection_cycle()
+
+    if watch is not None:
+        min_interval = 2  # seconds; rate-limit bursts of file events
+        last_run = time.monotonic()
+        for _changes in watch(*_watch_inputs(), debounce=1000):
+            wait = min_interval - (time.monotonic() - last_run)
+            if wait > 0:
+                time.sleep(wait)
+            run_collection_cycle()
+            last_run = time.monotonic()
+    else:
+        # Fallback: the original fixed-interval poll loop
+        while True:
+            time.sleep(CONFIG["update_interval"])
+            run_collection_cycle()
 
 
 if __name__ == "__main__":
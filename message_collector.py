@@ -12,13 +12,45 @@ Output format:
 {"timestamp": "ISO", "from": "agent-name", "to": "agent-name", "message": "text", "type": "delegate|question|answer|spawn"}
 """
 
+import hashlib
 import json
 import os
 import re
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Session transcripts are JSONL and parsing them dominates each run, so
+# use orjson (C parser, operates on bytes directly) when it is
+# installed; stdlib json is the fallback.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, default=str)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, separators=(',', ':'), default=str).encode()
+
+# The google-re2 binding exposes the stdlib compile/search API backed by
+# a linear-time DFA. Use it for plain pattern compiles when installed.
+# _TYPE_REGEX stays on stdlib re either way: classification relies on
+# lastgroup, which re2 does not provide.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
 # Configuration
 CONFIG = {
     "sessions_dir": os.path.expanduser("~/.clawdbot/agents/main/sessions"),
@@ -28,6 +60,17 @@ CONFIG = {
     "max_messages": 100,
 }
 
+# Hot paths bind these once instead of re-indexing CONFIG per call; the
+# output directory is created here so the per-save makedirs are gone.
+_SESSIONS_DIR = CONFIG["sessions_dir"]
+_SESSIONS_FILE = CONFIG["sessions_file"]
+_OUTPUT_FILE = CONFIG["output_file"]
+_STATE_FILE = CONFIG["state_file"]
+_MAX_MESSAGES = CONFIG["max_messages"]
+
+os.makedirs(os.path.dirname(_OUTPUT_FILE), exist_ok=True)
+os.makedirs(os.path.dirname(_STATE_FILE), exist_ok=True)
+
 # Communication patterns to detect
 COMMUNICATION_PATTERNS = {
     "delegate": [
@@ -59,6 +102,80 @@ COMMUNICATION_PATTERNS = {
 }
 
 
+# All non-jarvis communication patterns fused into one alternation with
+# one named group per category, so classification is a single scan of
+# the text instead of up to 12 and lastgroup is the category itself.
+# IGNORECASE replaces the lower() copy.
+_TYPE_REGEX = re.compile(
+    "|".join(
+        f"(?P<{msg_type}>{'|'.join(f'(?:{pattern})' for pattern in patterns)})"
+        for msg_type, patterns in COMMUNICATION_PATTERNS.items()
+        if msg_type != "jarvis_activity"
+    ),
+    re.IGNORECASE
+)
+
+# Optional Hyperscan database over the same patterns: a true
+# multi-pattern DFA scans the text once in linear time regardless of
+# pattern count. Optional dependency — without it classification stays
+# on the combined _TYPE_REGEX alternation.
+try:
+    import hyperscan
+
+    _HS_TYPES = [
+        msg_type
+        for msg_type, patterns in COMMUNICATION_PATTERNS.items()
+        if msg_type != "jarvis_activity"
+        for _ in patterns
+    ]
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[
+            pattern.encode()
+            for msg_type, patterns in COMMUNICATION_PATTERNS.items()
+            if msg_type != "jarvis_activity"
+            for pattern in patterns
+        ],
+        ids=list(range(len(_HS_TYPES))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_HS_TYPES),
+    )
+except ImportError:
+    _HS_DB = None
+
+# Every non-jarvis COMMUNICATION_PATTERNS entry contains at least one
+# of these literals, so a C-level substring pass can rule a line out
+# before any regex runs. Keep this covering set in sync with the
+# patterns above.
+_LITERAL_KEYWORDS = (
+    "delegat", "assign", "hand off", "pass", "spawn", "create", "ask",
+    "have", "agent", "help", "question", "assist", "session",
+    "completed", "finished", "done",
+)
+
+# Optional Aho–Corasick automaton over the same covering literals,
+# scanning them all in one O(len(text)) pass with a C backend instead of
+# one substring search per keyword. It is a prefilter only — a hit means
+# the fused regex is worth running, a miss rules the line out — so
+# classification is always regex-derived whether or not the package is
+# installed. Same optional-dependency treatment as the agent-keyword
+# automaton in kanban.py.
+try:
+    import ahocorasick
+
+    _TYPE_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _LITERAL_KEYWORDS:
+        _TYPE_AUTOMATON.add_word(_kw, _kw)
+    _TYPE_AUTOMATON.make_automaton()
+except ImportError:
+    _TYPE_AUTOMATON = None
+
+# Target-agent extraction, shared across all messages
+_TARGET_RE = _re.compile(
+    r"(?:to|from|ask|delegate)\s+(?:agent|sub[-]?agent)?\s*['\"]?([a-zA-Z0-9_-]+)['\"]?",
+    re.IGNORECASE
+)
+
+
 def get_timestamp() -> str:
     """Get current UTC timestamp in ISO format."""
     return datetime.now(timezone.utc).isoformat()
@@ -67,75 +184,161 @@ def get_timestamp() -> str:
 def load_collector_state() -> dict[str, Any]:
     """Load the collector state (last read positions per file)."""
     state = {
-        "files": {},  # filename -> {"last_position": int, "last_modified": float}
+        "files": {},  # filename -> [last_position, last_modified]
         "version": 1,
     }
-    
+
     try:
-        if os.path.exists(CONFIG["state_file"]):
-            with open(CONFIG["state_file"], 'r') as f:
-                state = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        if os.path.exists(_STATE_FILE):
+            with open(_STATE_FILE, 'rb') as f:
+                state = _loads(f.read())
+            # Migrate the older per-file dict layout in place
+            state["files"] = {
+                name: [fs["last_position"], fs["last_modified"]] if isinstance(fs, dict) else fs
+                for name, fs in state.get("files", {}).items()
+            }
+    except (ValueError, IOError, KeyError) as e:
         print(f"[MessageCollector] Warning: Could not load state file: {e}")
-    
+
     return state
 
 
 def save_collector_state(state: dict[str, Any]) -> None:
     """Save the collector state."""
     try:
-        os.makedirs(os.path.dirname(CONFIG["state_file"]), exist_ok=True)
-        with open(CONFIG["state_file"], 'w') as f:
-            json.dump(state, f, indent=2)
+        # Machine-only file: compact output, no indent walk
+        with open(_STATE_FILE, 'wb') as f:
+            f.write(_dumps(state))
     except IOError as e:
         print(f"[MessageCollector] Error saving state: {e}")
 
 
-def load_existing_messages() -> list[dict]:
+# Parsed output file keyed on its stat signature so repeat callers
+# skip the reparse while the file is unchanged
+_EXISTING_MSGS_CACHE: dict[str, Any] = {"key": None, "messages": None}
+
+
+def load_existing_messages() -> list[dict[str, Any]]:
     """Load existing messages from the output file."""
     messages = []
-    
+
     try:
-        if os.path.exists(CONFIG["output_file"]):
-            with open(CONFIG["output_file"], 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            messages.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            pass
+        if os.path.exists(_OUTPUT_FILE):
+            st = os.stat(_OUTPUT_FILE)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if _EXISTING_MSGS_CACHE["key"] == cache_key:
+                return _EXISTING_MSGS_CACHE["messages"]
+
+            # One bulk read + C-level newline split instead of the
+            # Python line iterator with a strip() copy per line.
+            with open(_OUTPUT_FILE, 'rb') as f:
+                data = f.read()
+            for line in data.split(b'\n'):
+                if line:
+                    try:
+                        messages.append(_loads(line))
+                    except ValueError:
+                        pass
+
+            _EXISTING_MSGS_CACHE["key"] = cache_key
+            _EXISTING_MSGS_CACHE["messages"] = messages
     except IOError as e:
         print(f"[MessageCollector] Error loading existing messages: {e}")
-    
+
     return messages
 
 
-def save_messages(messages: list[dict]) -> None:
+# Digest of the last payload save_messages wrote, to skip identical
+# rewrites
+_last_messages_digest: bytes | None = None
+
+
+def save_messages(messages: list[dict[str, Any]]) -> None:
     """Save messages to the output file (keep only last max_messages)."""
+    global _last_messages_digest
+
     try:
-        os.makedirs(os.path.dirname(CONFIG["output_file"]), exist_ok=True)
-        
         # Keep only the last max_messages
-        messages_to_keep = messages[-CONFIG["max_messages"]:]
-        
-        with open(CONFIG["output_file"], 'w') as f:
-            for msg in messages_to_keep:
-                f.write(json.dumps(msg) + '\n')
-                
+        messages_to_keep = messages[-_MAX_MESSAGES:]
+
+        # Serialize everything first and issue a single write instead
+        # of one buffered write per message.
+        payload = b''.join(_dumps(msg) + b'\n' for msg in messages_to_keep)
+
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == _last_messages_digest:
+            return
+
+        # Write to a temp file and rename so API readers never observe
+        # a truncated file
+        tmp_path = f"{_OUTPUT_FILE}.tmp.{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, _OUTPUT_FILE)
+        _last_messages_digest = digest
     except IOError as e:
         print(f"[MessageCollector] Error saving messages: {e}")
 
 
-def get_session_info() -> dict[str, dict]:
+def append_messages(new_messages: list[dict[str, Any]]) -> None:
+    """Append new messages to the output file without rewriting it."""
+    if not new_messages:
+        return
+
+    try:
+        payload = b''.join(_dumps(msg) + b'\n' for msg in new_messages)
+        with open(_OUTPUT_FILE, 'ab') as f:
+            f.write(payload)
+    except IOError as e:
+        print(f"[MessageCollector] Error appending messages: {e}")
+
+
+def tail_messages(limit: int) -> list[dict[str, Any]]:
+    """Read the last `limit` messages without parsing the whole file."""
+    # maxlen deque evicts as it fills, so no trailing [-limit:] slice
+    messages: deque = deque(maxlen=limit)
+
+    try:
+        if os.path.exists(_OUTPUT_FILE):
+            # Messages are short, so the last 64KB comfortably covers
+            # the tail we need; a partial first line fails to parse and
+            # is skipped.
+            with open(_OUTPUT_FILE, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - 65536))
+                data = f.read()
+            for line in data.split(b'\n')[-(limit + 1):]:
+                if line:
+                    try:
+                        messages.append(_loads(line))
+                    except ValueError:
+                        pass
+    except IOError as e:
+        print(f"[MessageCollector] Error reading message tail: {e}")
+
+    return list(messages)
+
+
+# Parsed sessions.json keyed on its stat signature, so long-running
+# importers (the dashboard server) only re-parse when the file changes
+_SESSIONS_INFO_CACHE: dict[str, Any] = {"key": None, "info": None}
+
+
+def get_session_info() -> dict[str, dict[str, Any]]:
     """Get session metadata from sessions.json."""
     sessions_info = {}
-    
+
     try:
-        if os.path.exists(CONFIG["sessions_file"]):
-            with open(CONFIG["sessions_file"], 'r') as f:
-                data = json.load(f)
-            
+        if os.path.exists(_SESSIONS_FILE):
+            st = os.stat(_SESSIONS_FILE)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if _SESSIONS_INFO_CACHE["key"] == cache_key:
+                return _SESSIONS_INFO_CACHE["info"]
+
+            with open(_SESSIONS_FILE, 'rb') as f:
+                data = _loads(f.read())
+
             for session_key, session_data in data.items():
                 session_id = session_data.get("sessionId", "")
                 # Convert createdAt timestamp to ISO format
@@ -156,73 +359,106 @@ def get_session_info() -> dict[str, dict]:
                     "model": session_data.get("model", "unknown"),
                     "created_at": created_at,
                 }
-    except (json.JSONDecodeError, IOError) as e:
+
+            _SESSIONS_INFO_CACHE["key"] = cache_key
+            _SESSIONS_INFO_CACHE["info"] = sessions_info
+    except (ValueError, IOError) as e:
         print(f"[MessageCollector] Error reading sessions.json: {e}")
-    
+
     return sessions_info
 
 
-def detect_communication_type(text: str) -> str | None:
-    """Detect the type of communication based on patterns."""
-    text_lower = text.lower()
-    
-    for msg_type, patterns in COMMUNICATION_PATTERNS.items():
-        # Skip jarvis_activity patterns - handled separately
-        if msg_type == "jarvis_activity":
-            continue
-        for pattern in patterns:
-            if re.search(pattern, text_lower):
-                return msg_type
-    
-    return None
+def detect_communication_type(text: str, text_lower: str | None = None) -> str | None:
+    """Detect the type of communication based on patterns.
+
+    Callers that already hold a lowered copy of the text (the literal
+    prefilter does) can pass it as `text_lower` to spare the automaton
+    path a second lower() allocation.
+    """
+    # jarvis_activity patterns are excluded from the scan - handled separately
+    if _TYPE_AUTOMATON is not None:
+        # Prefilter: no covering literal in the text means no pattern
+        # can match, so skip the regex entirely. A hit falls through to
+        # the real classifiers below.
+        for _hit in _TYPE_AUTOMATON.iter(text_lower if text_lower is not None else text.lower()):
+            break
+        else:
+            return None
+    if _HS_DB is not None:
+        hits: list[tuple[int, int]] = []
+        _HS_DB.scan(
+            text.encode(),
+            match_event_handler=lambda mid, start, end, flags, ctx: hits.append((end, mid)),
+        )
+        if hits:
+            return _HS_TYPES[min(hits)[1]]
+        return None
+    match = _TYPE_REGEX.search(text)
+    return match.lastgroup if match else None
+
+
+def _describe_edit(args: dict[str, Any]) -> str:
+    path = args.get("path")
+    return f"Updated code in {path.rsplit('/', 1)[-1]}" if path else "Updated code"
+
+
+def _describe_write(args: dict[str, Any]) -> str:
+    file_path = args.get("file_path")
+    return f"Created new file: {file_path.rsplit('/', 1)[-1]}" if file_path else "Created new file"
+
+
+def _describe_exec(args: dict[str, Any]) -> str:
+    command = args.get("command")
+    if not command:
+        return "Ran command"
+    cmd = command[:30] + "..." if len(command) > 30 else command
+    return f"Ran command: {cmd}"
+
+
+def _describe_web_search(args: dict[str, Any]) -> str:
+    query = args.get("query")
+    if not query:
+        return "Searched the web"
+    query = query[:40] + "..." if len(query) > 40 else query
+    return f"Searched the web: {query}"
+
+
+# One formatter per tool, looked up in a single dict hit per call; the
+# description table itself is no longer rebuilt on every invocation.
+# Internal/meta tools and sessions_spawn (handled separately) are
+# simply absent.
+_TOOL_FORMATTERS: dict[str, Any] = {
+    "edit": _describe_edit,
+    "write": _describe_write,
+    "read": "Read file contents",
+    "exec": _describe_exec,
+    "web_search": _describe_web_search,
+    "web_fetch": "Fetched web content",
+    "browser": "Controlled browser",
+    "image": "Analyzed image",
+    "cron": "Managed scheduled task",
+    "message": "Sent message",
+    "sessions_send": "Sent message to sub-agent",
+    "todoist": "Updated tasks",
+    "canvas": "Updated canvas",
+    "nodes": "Accessed device",
+    "whatsapp_login": "WhatsApp action",
+}
 
 
-def get_tool_description(tool_name: str, args: dict) -> str | None:
+def get_tool_description(tool_name: str, args: dict[str, Any]) -> str | None:
     """Generate a human-readable description of a tool call."""
-    # Skip internal/meta tools
-    if tool_name in ["sessions_list", "sessions_history", "session_status", "memory_search", "memory_get"]:
+    formatter = _TOOL_FORMATTERS.get(tool_name)
+    if formatter is None:
         return None
-    
-    tool_descriptions = {
-        "edit": "Updated code",
-        "write": "Created new file",
-        "read": "Read file contents",
-        "exec": "Ran command",
-        "web_search": "Searched the web",
-        "web_fetch": "Fetched web content",
-        "browser": "Controlled browser",
-        "image": "Analyzed image",
-        "cron": "Managed scheduled task",
-        "message": "Sent message",
-        "sessions_spawn": None,  # Handled separately
-        "sessions_send": "Sent message to sub-agent",
-        "todoist": "Updated tasks",
-        "canvas": "Updated canvas",
-        "nodes": "Accessed device",
-        "whatsapp_login": "WhatsApp action",
-    }
-    
-    desc = tool_descriptions.get(tool_name)
-    if desc:
-        # Add context if available
-        if tool_name == "edit" and args.get("path"):
-            return f"{desc} in {args['path'].split('/')[-1]}"
-        if tool_name == "write" and args.get("file_path"):
-            return f"{desc}: {args['file_path'].split('/')[-1]}"
-        if tool_name == "exec" and args.get("command"):
-            cmd = args["command"][:30] + "..." if len(args["command"]) > 30 else args["command"]
-            return f"{desc}: {cmd}"
-        if tool_name == "web_search" and args.get("query"):
-            query = args["query"][:40] + "..." if len(args["query"]) > 40 else args["query"]
-            return f"{desc}: {query}"
-    
-    return desc
+    return formatter(args) if callable(formatter) else formatter
 
 
-def detect_jarvis_activity(text: str) -> str | None:
-    """Detect when Jarvis is actively working on something for the user."""
-    # Patterns indicating Jarvis is doing work
-    work_patterns = [
+# Patterns indicating Jarvis is doing work, compiled once with
+# IGNORECASE so no lowered copy of the text is ever allocated
+_WORK_PATTERNS = [
+    (_re.compile(pattern, re.IGNORECASE), summary)
+    for pattern, summary in [
         (r"(?:i'm|i am|ill|i'll)\s+(?:implement|build|create|update|fix|refactor|working on|developing|adding|changing|setting up)", "Working on implementation"),
         (r"(?:let me|lemme)\s+(?:implement|build|create|update|fix|refactor|work on|develop|add|change|set up)", "Working on it"),
         (r"(?:done|completed|finished)\s+(?:implement|build|update|fix|refactor|add|change)", "Completed implementation"),
@@ -231,31 +467,88 @@ def detect_jarvis_activity(text: str) -> str | None:
         (r"(?:updating|fixing|adding|changing)\s+(?:the|your|this)", "Making updates"),
         (r"(?:just|now)\s+(?:implemented|built|created|updated|fixed|refactored|added|changed)", "Just completed"),
     ]
-    
-    text_lower = text.lower()
-    for pattern, summary in work_patterns:
-        if re.search(pattern, text_lower):
+]
+
+_WORK_WHAT_RE = _re.compile(
+    r"(?:implement|build|create|update|fix|add|change|set up)\s+(?:the\s+)?([^,.]+)",
+    re.IGNORECASE
+)
+
+_COMPLETION_PATTERNS = [
+    _re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"(?:all\s+)?(?:done|complete|finished|ready)",
+        r"(?:here's|here is|ive|i've)\s+(?:implemented|built|created|updated|fixed|added|completed)",
+        r"(?:successfully|just)\s+(?:implemented|built|created|updated|fixed|added|completed)",
+    ]
+]
+
+
+# With hyperscan present, the activity and completion pattern lists
+# collapse into one database each; ids follow list order and the lowest
+# hit id wins, preserving the list-priority semantics of the loops.
+if _HS_DB is not None:
+    _HS_WORK_DB = hyperscan.Database()
+    _HS_WORK_DB.compile(
+        expressions=[pattern.pattern.encode() for pattern, _ in _WORK_PATTERNS],
+        ids=list(range(len(_WORK_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_WORK_PATTERNS),
+    )
+    _HS_COMPLETION_DB = hyperscan.Database()
+    _HS_COMPLETION_DB.compile(
+        expressions=[pattern.pattern.encode() for pattern in _COMPLETION_PATTERNS],
+        ids=list(range(len(_COMPLETION_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_COMPLETION_PATTERNS),
+    )
+else:
+    _HS_WORK_DB = None
+    _HS_COMPLETION_DB = None
+
+
+def _hs_first_hit(db, text: str) -> int | None:
+    """Scan `db` over `text` and return the lowest matching pattern id."""
+    hits: list[int] = []
+    db.scan(
+        text.encode(),
+        match_event_handler=lambda mid, start, end, flags, ctx: hits.append(mid),
+    )
+    return min(hits) if hits else None
+
+
+def detect_jarvis_activity(text: str) -> str | None:
+    """Detect when Jarvis is actively working on something for the user."""
+    if _HS_WORK_DB is not None:
+        hit = _hs_first_hit(_HS_WORK_DB, text)
+        if hit is None:
+            return None
+        what_match = _WORK_WHAT_RE.search(text)
+        if what_match:
+            what = what_match.group(1).strip()[:50]
+            return f"{_WORK_PATTERNS[hit][1]}: {what}"
+        return _WORK_PATTERNS[hit][1]
+    for pattern, summary in _WORK_PATTERNS:
+        if pattern.search(text):
             # Try to extract what specifically is being worked on
-            what_match = re.search(r"(?:implement|build|create|update|fix|add|change|set up)\s+(?:the\s+)?([^,.]+)", text_lower)
+            what_match = _WORK_WHAT_RE.search(text)
             if what_match:
                 what = what_match.group(1).strip()[:50]
                 return f"{summary}: {what}"
             return summary
-    
+
     return None
 
 
 def detect_completion_statement(text: str) -> str | None:
     """Detect when Jarvis is reporting completion of work."""
-    completion_patterns = [
-        r"(?:all\s+)?(?:done|complete|finished|ready)",
-        r"(?:here's|here is|ive|i've)\s+(?:implemented|built|created|updated|fixed|added|completed)",
-        r"(?:successfully|just)\s+(?:implemented|built|created|updated|fixed|added|completed)",
-    ]
-    
-    text_lower = text.lower()
-    for pattern in completion_patterns:
-        if re.search(pattern, text_lower):
+    if _HS_COMPLETION_DB is not None:
+        # The question/first-sentence checks below depend only on the
+        # text, so any hit at all is enough
+        if _hs_first_hit(_HS_COMPLETION_DB, text) is None or "?" in text[:100]:
+            return None
+        first_sent = text.split(".")[0][:80] + "..." if len(text) > 80 else text.split(".")[0]
+        return first_sent if len(first_sent) > 20 else None
+    for pattern in _COMPLETION_PATTERNS:
+        if pattern.search(text):
             # Check it's not a question
             if "?" in text[:100]:
                 continue
@@ -267,8 +560,9 @@ def detect_completion_statement(text: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def get_bot_name() -> str:
-    """Read bot name from IDENTITY.md in workspace root."""
+    """Read bot name from IDENTITY.md in workspace root (cached after first read)."""
     identity_file = "/home/chris/clawd/IDENTITY.md"
     try:
         if os.path.exists(identity_file):
@@ -285,10 +579,6 @@ def get_bot_name() -> str:
     return "Jarvis"
 
 
-# Cache bot name at module load
-_BOT_NAME = get_bot_name()
-
-
 # Friends TV Show character names for sub-agents (66 total)
 FRIENDS_CHARACTERS = [
     # Main Cast (6)
@@ -310,16 +600,17 @@ FRIENDS_CHARACTERS = [
 ]
 
 
+@lru_cache(maxsize=256)
 def get_friends_name_from_session_key(session_key: str) -> str:
     """Generate a consistent Friends character name from session key."""
-    import hashlib
-    # Use hash of session key to pick a consistent character
-    hash_val = int(hashlib.md5(session_key.encode()).hexdigest(), 16)
-    return FRIENDS_CHARACTERS[hash_val % len(FRIENDS_CHARACTERS)]
+    # crc32 is stable across processes (unlike built-in hash()) and
+    # picks an index without a crypto digest or hex round-trip
+    return FRIENDS_CHARACTERS[zlib.crc32(session_key.encode()) % len(FRIENDS_CHARACTERS)]
 
 
+@lru_cache(maxsize=512)
 def extract_agent_name_from_session_key(session_key: str) -> str:
-    """Extract a readable agent name from session key."""
+    """Extract a readable agent name from session key (memoized; keys repeat every run)."""
     if not session_key:
         return "unknown"
     
@@ -329,7 +620,7 @@ def extract_agent_name_from_session_key(session_key: str) -> str:
         return get_friends_name_from_session_key(session_key)
     
     if "main:main" in session_key:
-        return _BOT_NAME
+        return get_bot_name()
     
     # Default: return last part or truncated key
     parts = session_key.split(":")
@@ -338,24 +629,26 @@ def extract_agent_name_from_session_key(session_key: str) -> str:
 
 def parse_session_file(
     filepath: Path,
-    file_state: dict,
-    sessions_info: dict[str, dict]
-) -> list[dict]:
+    file_state: list,
+    sessions_info: dict[str, dict[str, Any]],
+    stat: os.stat_result | None = None
+) -> list[dict[str, Any]]:
     """
     Parse a session transcript file and extract communication messages.
     Returns list of new messages found.
     """
     new_messages = []
-    
+
     try:
-        # Get current file stats
-        stat = filepath.stat()
+        # Get current file stats (the caller usually already has them
+        # from scandir, saving a syscall per file)
+        if stat is None:
+            stat = filepath.stat()
         current_size = stat.st_size
         current_mtime = stat.st_mtime
         
         # Check if file has been modified since last read
-        last_position = file_state.get("last_position", 0)
-        last_mtime = file_state.get("last_modified", 0)
+        last_position, last_mtime = file_state
         
         # If file was modified or rotated (smaller than before), reset position
         if current_mtime < last_mtime or current_size < last_position:
@@ -367,36 +660,38 @@ def parse_session_file(
             return new_messages
         
         # Get session info for this file
-        session_id = filepath.stem.replace(".jsonl", "")
+        # .stem has already dropped the .jsonl suffix
+        session_id = filepath.stem
         session_info = sessions_info.get(session_id, {})
         session_key = session_info.get("key", "unknown")
         agent_name = extract_agent_name_from_session_key(session_key)
         
-        # Read new lines from the file
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            # Seek to last position
-            f.seek(last_position)
-            
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    msg = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                
-                # Parse different message types
-                messages = extract_messages_from_entry(msg, agent_name, session_key, sessions_info)
-                new_messages.extend(messages)
-            
-            # Update position to current end of file
-            new_position = f.tell()
+        # Read exactly the new bytes with a single pread (no buffered
+        # file object, no seek) and split on newlines in C; byte
+        # positions also make the offset arithmetic exact.
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            data = os.pread(fd, current_size - last_position, last_position)
+        finally:
+            os.close(fd)
+        new_position = last_position + len(data)
+
+        for line in data.split(b'\n'):
+            if not line:
+                continue
+
+            try:
+                msg = _loads(line)
+            except ValueError:
+                continue
+
+            # Parse different message types
+            messages = extract_messages_from_entry(msg, agent_name, session_key, sessions_info)
+            new_messages.extend(messages)
         
         # Update file state
-        file_state["last_position"] = new_position
-        file_state["last_modified"] = current_mtime
+        file_state[0] = new_position
+        file_state[1] = current_mtime
         
     except IOError as e:
         print(f"[MessageCollector] Error reading {filepath}: {e}")
@@ -405,11 +700,11 @@ def parse_session_file(
 
 
 def extract_messages_from_entry(
-    msg: dict,
+    msg: dict[str, Any],
     agent_name: str,
     session_key: str,
-    sessions_info: dict[str, dict]
-) -> list[dict]:
+    sessions_info: dict[str, dict[str, Any]]
+) -> list[dict[str, Any]]:
     """Extract communication messages from a single transcript entry."""
     messages = []
     
@@ -437,56 +732,30 @@ def extract_messages_from_entry(
         message_data = msg.get("message", {})
         content = message_data.get("content", [])
         
-        # Extract text from content
-        full_text = ""
+        # One pass over content: gather text/thinking for full_text and
+        # handle toolCall items as they go by, instead of walking the
+        # list a second time
+        parts = []
+        tool_messages = []
         for item in content:
-            if isinstance(item, dict):
-                if item.get("type") == "text":
-                    full_text += item.get("text", "")
-                elif item.get("type") == "thinking":
-                    full_text += item.get("thinking", "")
-        
-        if not full_text:
-            return messages
-        
-        # Detect communication patterns
-        comm_type = detect_communication_type(full_text)
-        
-        if comm_type:
-            # Determine target agent
-            to_agent = "unknown"
-            
-            # Try to extract target from text
-            target_match = re.search(
-                r"(?:to|from|ask|delegate)\s+(?:agent|sub[-]?agent)?\s*['\"]?([a-zA-Z0-9_-]+)['\"]?",
-                full_text.lower()
-            )
-            if target_match:
-                to_agent = target_match.group(1)
-            else:
-                to_agent = "subagent" if comm_type in ["delegate", "spawn"] else "another-agent"
-            
-            # Create message (truncate if too long)
-            summary = full_text[:200] + "..." if len(full_text) > 200 else full_text
-            
-            messages.append({
-                "timestamp": timestamp,
-                "from": agent_name,
-                "to": to_agent,
-                "message": summary,
-                "type": comm_type
-            })
-        
-        # Also check for explicit subagent references in tool calls
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "toolCall":
+            if not isinstance(item, dict):
+                continue
+            try:
+                item_type = item["type"]
+            except KeyError:
+                continue
+            if item_type == "text":
+                parts.append(item.get("text", ""))
+            elif item_type == "thinking":
+                parts.append(item.get("thinking", ""))
+            elif item_type == "toolCall":
                 tool_name = item.get("name", "")
                 if tool_name == "sessions_spawn":
                     args = item.get("arguments", {})
                     task = args.get("task", "")[:100]
                     label = args.get("label", "subagent")
-                    
-                    messages.append({
+
+                    tool_messages.append({
                         "timestamp": timestamp,
                         "from": agent_name,
                         "to": label,
@@ -497,14 +766,50 @@ def extract_messages_from_entry(
                     # Track Jarvis (main agent) tool usage as activity
                     tool_desc = get_tool_description(tool_name, item.get("arguments", {}))
                     if tool_desc:
-                        messages.append({
+                        tool_messages.append({
                             "timestamp": timestamp,
                             "from": "Jarvis",
                             "to": "Chris",
                             "message": tool_desc,
                             "type": "jarvis_activity"
                         })
+        full_text = "".join(parts)
+
+        if not full_text:
+            return messages
+
+        # Detect communication patterns; most transcript text contains
+        # no pattern keyword at all, so a literal scan gates the regex
+        lowered = full_text.lower()
+        comm_type = None
+        if any(kw in lowered for kw in _LITERAL_KEYWORDS):
+            comm_type = detect_communication_type(full_text, lowered)
+
+        if comm_type:
+            # Determine target agent
+            to_agent = "unknown"
+            
+            # Try to extract target from text
+            target_match = _TARGET_RE.search(full_text)
+            if target_match:
+                to_agent = target_match.group(1).lower()
+            else:
+                to_agent = "subagent" if comm_type in ["delegate", "spawn"] else "another-agent"
+            
+            # Create message (truncate if too long)
+            summary = full_text[:200] + "..." if len(full_text) > 200 else full_text
+            
+            messages.append({
+                "timestamp": timestamp,
+                "from": agent_name,
+                "to": to_agent,
+                "message": summary,
+                "type": comm_type
+            })
         
+        # Subagent references found in tool calls during the pass above
+        messages.extend(tool_messages)
+
         # For main session (Jarvis), also detect activity patterns in responses
         if is_main_session and message_data.get("role") == "assistant":
             activity = detect_jarvis_activity(full_text)
@@ -532,26 +837,28 @@ def extract_messages_from_entry(
 
 def get_session_creation_time(session_id: str) -> str | None:
     """Get session creation time from transcript file."""
-    transcript_path = Path(CONFIG["sessions_dir"]) / f"{session_id}.jsonl"
+    transcript_path = Path(_SESSIONS_DIR) / f"{session_id}.jsonl"
     if not transcript_path.exists():
         return None
     
     try:
-        with open(transcript_path, 'r') as f:
-            first_line = f.readline().strip()
-            if first_line:
-                entry = json.loads(first_line)
+        # The parser tolerates surrounding whitespace, so no strip copy
+        with open(transcript_path, 'rb') as f:
+            first_line = f.readline()
+            if len(first_line) > 1:
+                entry = _loads(first_line)
                 return entry.get("timestamp")
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, IOError):
         pass
     
     return None
 
 
-def detect_spawn_relationships(sessions_info: dict[str, dict]) -> list[dict]:
-    """Detect agent spawn relationships from sessions.json."""
+def detect_spawn_relationships(sessions_info: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """Detect agent spawn relationships from sessions.json, deduplicated."""
     messages = []
-    
+    seen: set[int] = set()
+
     for session_id, info in sessions_info.items():
         spawned_by = info.get("spawned_by")
         if spawned_by:
@@ -571,72 +878,97 @@ def detect_spawn_relationships(sessions_info: dict[str, dict]) -> list[dict]:
             if not created_at:
                 created_at = get_timestamp()
             
+            message = f"Spawned subagent for task: {info.get('label', 'unknown task')}"
+
+            # Dedup in the same pass (same from/to/message prefix)
+            key = hash((parent_name, child_name, message[:50]))
+            if key in seen:
+                continue
+            seen.add(key)
+
             messages.append({
                 "timestamp": created_at,
                 "from": parent_name,
                 "to": child_name,
-                "message": f"Spawned subagent for task: {info.get('label', 'unknown task')}",
+                "message": message,
                 "type": "spawn"
             })
-    
+
     return messages
 
 
-def collect_messages() -> list[dict]:
+def collect_messages() -> list[dict[str, Any]]:
     """Main collection function - gather all agent messages."""
     print(f"[{get_timestamp()}] MessageCollector: Starting collection...")
     
-    # Load state and existing messages
+    # Load state; the messages already on disk don't need reparsing
+    # because new ones are appended rather than rewritten in place.
     state = load_collector_state()
-    existing_messages = load_existing_messages()
-    
+
     # Get session metadata
     sessions_info = get_session_info()
     
     # Track new messages
     all_new_messages = []
     
-    # Parse all session transcript files
-    sessions_dir = Path(CONFIG["sessions_dir"])
-    if sessions_dir.exists():
-        for jsonl_file in sessions_dir.glob("*.jsonl"):
-            # Skip lock files and deleted files (files with multiple suffixes like .jsonl.lock or .jsonl.deleted)
-            if len(jsonl_file.suffixes) > 1 or ".deleted" in jsonl_file.name or ".lock" in jsonl_file.name:
-                continue
-            
-            file_state = state["files"].get(jsonl_file.name, {})
-            new_messages = parse_session_file(jsonl_file, file_state, sessions_info)
-            
-            if new_messages:
-                all_new_messages.extend(new_messages)
-                print(f"[MessageCollector] {jsonl_file.name}: {len(new_messages)} new messages")
-            
-            # Update state for this file
-            state["files"][jsonl_file.name] = file_state
-    
-    # Add spawn relationships from sessions.json
-    spawn_messages = detect_spawn_relationships(sessions_info)
-    
-    # Filter out duplicates (same from/to/message within last minute)
-    seen = set()
-    unique_spawn_messages = []
-    for msg in spawn_messages:
-        key = (msg["from"], msg["to"], msg["message"][:50])
-        if key not in seen:
-            seen.add(key)
-            unique_spawn_messages.append(msg)
-    
-    all_new_messages.extend(unique_spawn_messages)
-    
-    # Combine with existing messages
-    all_messages = existing_messages + all_new_messages
-    
-    # Trim to max size
-    if len(all_messages) > CONFIG["max_messages"]:
-        all_messages = all_messages[-CONFIG["max_messages"]:]
-    
-    # Save updated messages and state
-    save_messages(all_messages)
+    # Parse all session transcript files; scandir yields cached stat
+    # results, so the whole directory is covered with one getdents pass
+    to_parse = []
+    if os.path.isdir(_SESSIONS_DIR):
+        with os.scandir(_SESSIONS_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                # Skip lock files and deleted files (names with multiple suffixes like .jsonl.lock or .jsonl.deleted)
+                if not name.endswith(".jsonl") or name.count(".") > 1 or not entry.is_file():
+                    continue
+
+                file_state = state["files"].get(name) or [0, 0.0]
+
+                # Skip unchanged files on the stat alone, before
+                # parse_session_file touches them.
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if st.st_mtime == file_state[1] and st.st_size == file_state[0]:
+                    continue
+
+                to_parse.append((name, Path(entry.path), file_state, st))
+
+    # Parse changed files concurrently: the work is file reads plus
+    # JSONL decoding, and each task owns its file's state list, so
+    # nothing is shared between workers
+    if to_parse:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as executor:
+            futures = {
+                executor.submit(parse_session_file, path, file_state, sessions_info, st): (name, file_state)
+                for name, path, file_state, st in to_parse
+            }
+            for future in as_completed(futures):
+                name, file_state = futures[future]
+                new_messages = future.result()
+
+                if new_messages:
+                    all_new_messages.extend(new_messages)
+                    print(f"[MessageCollector] {name}: {len(new_messages)} new messages")
+
+                # Update state for this file
+                state["files"][name] = file_state
+    
+    # Add spawn relationships from sessions.json (already deduplicated
+    # during detection)
+    all_new_messages.extend(detect_spawn_relationships(sessions_info))
+
+    # Append only the new messages; compact the file back down to
+    # max_messages once it has grown past twice that.
+    append_messages(all_new_messages)
+    state["output_lines"] = state.get("output_lines", 0) + len(all_new_messages)
+
+    all_messages = tail_messages(_MAX_MESSAGES)
+    if state["output_lines"] > 2 * _MAX_MESSAGES:
+        save_messages(all_messages)
+        state["output_lines"] = len(all_messages)
+
     save_collector_state(state)
     
     print(f"[{get_timestamp()}] MessageCollector: Collected {len(all_new_messages)} new messages, total {len(all_messages)}")
@@ -644,33 +976,36 @@ def collect_messages() -> list[dict]:
     return all_messages
 
 
-def get_messages_for_api() -> list[dict]:
+def _timestamp_is_recent(msg_time_str: str, cutoff_iso: str, cutoff_time: datetime) -> bool:
+    """Check whether a message timestamp falls within the API window."""
+    # ISO-8601 strings in the same UTC layout compare lexicographically,
+    # so collector-written timestamps need no parsing at all
+    if msg_time_str.endswith("+00:00"):
+        return msg_time_str >= cutoff_iso
+    try:
+        # Parse other ISO formats (legacy Z suffix, naive timestamps)
+        if msg_time_str:
+            msg_time = datetime.fromisoformat(msg_time_str.replace('Z', '+00:00'))
+            if msg_time.tzinfo is None:
+                msg_time = msg_time.replace(tzinfo=timezone.utc)
+            return msg_time >= cutoff_time
+    except (ValueError, TypeError):
+        # If we can't parse the timestamp, include it anyway
+        return True
+    return False
+
+
+def get_messages_for_api() -> list[dict[str, Any]]:
     """Get current messages for the API response (last 1 hour only)."""
-    from datetime import datetime, timedelta, timezone
-    
-    messages = load_existing_messages()
+    from datetime import timedelta
+
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=1)
-    
-    filtered_messages = []
-    for msg in messages:
-        try:
-            msg_time_str = msg.get("timestamp", "")
-            # Parse ISO format timestamp
-            if msg_time_str:
-                # Handle various ISO formats
-                msg_time_str = msg_time_str.replace('Z', '+00:00')
-                msg_time = datetime.fromisoformat(msg_time_str)
-                # Ensure timezone-aware
-                if msg_time.tzinfo is None:
-                    msg_time = msg_time.replace(tzinfo=timezone.utc)
-                
-                if msg_time >= cutoff_time:
-                    filtered_messages.append(msg)
-        except (ValueError, TypeError):
-            # If we can't parse the timestamp, include it anyway
-            filtered_messages.append(msg)
-    
-    return filtered_messages
+    cutoff_iso = cutoff_time.isoformat()
+
+    return [
+        msg for msg in tail_messages(_MAX_MESSAGES)
+        if _timestamp_is_recent(msg.get("timestamp", ""), cutoff_iso, cutoff_time)
+    ]
 
 
 if __name__ == "__main__":
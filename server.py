@@ -3,15 +3,42 @@ Clawdbot Dashboard - Backend API Server
 Phase 4: Agent Control Panel + Kanban Task Management
 """
 
+import atexit
+import hashlib
+import mmap
 import os
 import json
 import logging
+import re
 import signal
-import subprocess
+import threading
+import queue
+import time
 import datetime
-from pathlib import Path
-from flask import Flask, jsonify, send_from_directory, render_template, request
-from flask_cors import CORS
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from flask import Flask, render_template, request
+
+# orjson is a C extension that serializes/parses JSON several times faster
+# than the stdlib; fall back to stdlib json when it is not installed.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, default=str)
+
+except ImportError:
+    def _loads(data):
+        # stdlib json can't take buffer objects (mmap), orjson can
+        if not isinstance(data, (str, bytes, bytearray)):
+            data = bytes(data)
+        return json.loads(data)
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, default=str).encode()
 
 # Import Kanban module
 from kanban import (
@@ -20,35 +47,102 @@ from kanban import (
     KANBAN_COLUMNS
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: request threads enqueue records into a SimpleQueue
+# and a single background listener formats and writes them, keeping the
+# handler lock and I/O out of the request path. Level comes from the
+# environment so production can run at WARNING.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+))
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_root_logger.setLevel(os.environ.get('CLAW_DECK_LOG_LEVEL', 'INFO').upper())
+_root_logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
-app = Flask(__name__, 
+app = Flask(__name__,
             template_folder='templates',
             static_folder='static')
 
-# Enable CORS for local development
-CORS(app)
+# Let browsers cache static assets; Flask's built-in static route still
+# answers conditional requests with 304s, so updates propagate
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# CORS for local development: flask_cors ran config iteration and origin
+# regex matching per response; these three static headers are all the
+# dashboard needs
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+}
+
+
+@app.after_request
+def _add_cors_headers(response):
+    """Attach the static CORS headers to every response."""
+    response.headers.update(_CORS_HEADERS)
+    return response
+
+
+@app.before_request
+def _cors_preflight():
+    """Short-circuit CORS preflight requests before routing."""
+    if request.method == 'OPTIONS':
+        return '', 204
+
+
+def _json_response(data):
+    """Build a JSON response via _dumps instead of Flask's jsonify."""
+    return app.response_class(_dumps(data), mimetype='application/json')
 
 # Configuration
 STATE_FILE = '/home/chris/clawd/dashboard/current_state.json'
 CONTROL_LOG_FILE = '/home/chris/clawd/dashboard/control_log.jsonl'
+CONTROL_STATE_FILE = '/home/chris/clawd/dashboard/control_state.json'
 PORT = 5000
 HOST = '0.0.0.0'
 
 # Protected sessions that cannot be killed
 PROTECTED_SESSIONS = ['agent:main:main']
 
+# Cached parse of STATE_FILE, invalidated when the file's mtime changes
+_state_cache = {'mtime_ns': None, 'data': None, 'etag': None}
+
+
+def load_state_file():
+    """Return (data, etag) for STATE_FILE, re-parsing only when it changed on disk."""
+    st = os.stat(STATE_FILE)
+    if st.st_mtime_ns != _state_cache['mtime_ns']:
+        with open(STATE_FILE, 'rb') as f:
+            if st.st_size == 0:
+                _state_cache['data'] = _loads(b'')  # raises like the old json.load
+            else:
+                # Parse straight out of the page cache instead of copying
+                # the whole file into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mv = memoryview(mm)
+                    try:
+                        _state_cache['data'] = _loads(mv)
+                    finally:
+                        # must release before the mmap closes
+                        mv.release()
+        _state_cache['mtime_ns'] = st.st_mtime_ns
+        _state_cache['etag'] = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        logger.debug("State file loaded successfully")
+    return _state_cache['data'], _state_cache['etag']
+
 
 @app.route('/')
 def index():
     """Serve the main dashboard page."""
-    logger.info("Serving index.html")
+    logger.debug("Serving index.html")
     return render_template('index.html')
 
 
@@ -58,87 +152,244 @@ def get_state():
     Return the contents of current_state.json.
     Returns empty state if file doesn't exist yet.
     """
-    logger.info("GET /api/state requested")
+    logger.debug("GET /api/state requested")
     
     if not os.path.exists(STATE_FILE):
         logger.warning(f"State file not found: {STATE_FILE}")
-        return jsonify({
+        return _json_response({
             "status": "empty",
             "message": "No state file exists yet",
             "data": {}
         }), 200
     
     try:
-        with open(STATE_FILE, 'r') as f:
-            state_data = json.load(f)
-        logger.info("State file loaded successfully")
-        return jsonify({
+        state_data, etag = load_state_file()
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+        return _json_response({
             "status": "ok",
             "data": state_data
-        }), 200
-    except json.JSONDecodeError as e:
+        }), 200, {'ETag': etag}
+    except ValueError as e:
         logger.error(f"Invalid JSON in state file: {e}")
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Invalid JSON in state file: {str(e)}"
         }), 500
     except Exception as e:
         logger.error(f"Error reading state file: {e}")
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Error reading state file: {str(e)}"
         }), 500
 
 
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files from the static folder."""
-    logger.info(f"Serving static file: {filename}")
-    return send_from_directory('static', filename)
+# Control Log Functions
+
+# Incrementally maintained pause state; offset tracks how far into
+# CONTROL_LOG_FILE has already been replayed into the set.
+_paused_state = {'set': set(), 'offset': 0, 'lock': threading.Lock()}
+
+
+def _apply_control_entry(entry):
+    """Apply one control log entry to the in-memory paused set."""
+    if not entry.get('success'):
+        return
+    action = entry.get('action')
+    if action == 'pause':
+        _paused_state['set'].add(entry['session_key'])
+    elif action in ('resume', 'kill'):
+        _paused_state['set'].discard(entry['session_key'])
+
+
+# Log lines are batched through one long-lived handle so a burst of
+# actions (e.g. stop_all) costs a single write syscall instead of an
+# open/write/close per entry.
+_log_buffer = bytearray()
+_log_lock = threading.Lock()
+_log_file = None
+_log_flush_timer = None
+_LOG_FLUSH_INTERVAL = 0.05  # seconds
+
+# Once the log passes this size, its derived state is snapshotted to
+# CONTROL_STATE_FILE and the log truncated, bounding cold-start replay
+_CONTROL_LOG_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _get_log_file():
+    """Return the shared append handle for CONTROL_LOG_FILE, opening it once."""
+    global _log_file
+    if _log_file is None:
+        os.makedirs(os.path.dirname(CONTROL_LOG_FILE), exist_ok=True)
+        _log_file = open(CONTROL_LOG_FILE, 'ab', buffering=0)
+    return _log_file
+
+
+def _flush_control_log():
+    """Write any buffered control log lines to disk."""
+    global _log_flush_timer
+    with _log_lock:
+        _log_flush_timer = None
+        if not _log_buffer:
+            return
+        data = bytes(_log_buffer)
+        del _log_buffer[:]
+    try:
+        f = _get_log_file()
+        f.write(data)
+        os.fsync(f.fileno())
+        if f.tell() > _CONTROL_LOG_MAX_BYTES:
+            _compact_control_log()
+    except Exception as e:
+        logger.error(f"Failed to flush control log: {e}")
+
+
+atexit.register(_flush_control_log)
+
+
+def _write_log_line(line):
+    """Queue one encoded log line and schedule a near-term flush."""
+    global _log_flush_timer
+    with _log_lock:
+        _log_buffer.extend(line)
+        if _log_flush_timer is None:
+            _log_flush_timer = threading.Timer(_LOG_FLUSH_INTERVAL, _flush_control_log)
+            _log_flush_timer.daemon = True
+            _log_flush_timer.start()
+
+
+@app.after_request
+def _flush_log_after_request(response):
+    """Make sure buffered control actions hit disk before the response goes out."""
+    if _log_buffer:
+        _flush_control_log()
+    return response
+
+
+# Millisecond-cached timestamp: burst writes (stop_all, the batch
+# endpoints) reuse the formatted string instead of paying datetime
+# construction and formatting per entry
+_last_ts_ms = 0
+_last_ts_str = ''
+
+
+def _iso_now():
+    """ISO timestamp with millisecond precision, cached per millisecond."""
+    global _last_ts_ms, _last_ts_str
+    ms = time.time_ns() // 1_000_000
+    if ms != _last_ts_ms:
+        _last_ts_ms = ms
+        _last_ts_str = datetime.datetime.fromtimestamp(ms / 1000).isoformat(timespec='milliseconds')
+    return _last_ts_str
 
 
-# Control Log Functions
 def log_control_action(action, session_key, success=True, details=None):
     """Log a control action to the control log file."""
     try:
         log_entry = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "action": action,
             "session_key": session_key,
             "success": success,
             "details": details or {}
         }
-        with open(CONTROL_LOG_FILE, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
-        logger.info(f"Control action logged: {action} for {session_key}")
+        line = _dumps(log_entry) + b'\n'
+        _write_log_line(line)
+        with _log_lock:
+            _recent_actions.append(log_entry)
+        with _paused_state['lock']:
+            _apply_control_entry(log_entry)
+            _paused_state['offset'] += len(line)
+        logger.debug("Control action logged: %s for %s", action, session_key)
     except Exception as e:
         logger.error(f"Failed to log control action: {e}")
 
 
-def get_agent_pid(session_key):
+# One in-process /proc scan replaces a pgrep fork per lookup; the result
+# is shared for a couple of seconds so bursts of control actions reuse it.
+_PROC_SCAN_TTL = 2.0  # seconds
+_PROC_RETRY_AGE = 1.0  # rescan sooner when a requested key is missing
+_proc_scan_cache = {'time': 0.0, 'map': {}}
+
+# Pulls the session identifier out of an openclaw cmdline
+_SESSION_KEY_RE = re.compile(r'openclaw.*?([a-z]+:[a-z]+:[a-z0-9_-]+)')
+
+# Expanded once; Path.expanduser() per lookup adds up inside stop_all
+_PID_FILE_DIR = os.path.expanduser('~/.openclaw/agents/main/sessions')
+
+
+def _scan_proc_cmdlines():
+    """Scan /proc once, indexing openclaw session keys by PID."""
+    pid_by_session = {}
+    try:
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if b'openclaw' not in cmdline:
+                continue
+            match = _SESSION_KEY_RE.search(cmdline.replace(b'\x00', b' ').decode('utf-8', 'replace'))
+            if match:
+                # First match wins, matching the old pgrep behaviour
+                pid_by_session.setdefault(match.group(1), int(entry.name))
+    except OSError as e:
+        logger.error(f"Error scanning /proc: {e}")
+    return pid_by_session
+
+
+def _get_pid_index(missing_key=None):
+    """Return the cached session_key -> PID index, rescanning when stale."""
+    now = time.monotonic()
+    age = now - _proc_scan_cache['time']
+    if age > _PROC_SCAN_TTL or (missing_key is not None
+                                and missing_key not in _proc_scan_cache['map']
+                                and age > _PROC_RETRY_AGE):
+        _proc_scan_cache['map'] = _scan_proc_cmdlines()
+        _proc_scan_cache['time'] = now
+    return _proc_scan_cache['map']
+
+
+# Last-known PID per session; verified with a zero-signal probe before
+# reuse so the common "still alive" path costs one cheap syscall
+_pid_cache = {}
+
+
+def get_agent_pid(session_key, proc_map=None):
     """
     Find the PID of an agent process by session key.
-    Searches for openclaw agent processes matching the session.
+    Reuses the last-known PID when still alive, else looks the session
+    up in the indexed /proc scan.
     """
     try:
-        # Try to find process by session key in command line or environment
-        # Openclaw agents run as part of the gateway, so we look for matching patterns
-        
-        # First, try to find any node processes with matching session info
-        result = subprocess.run(
-            ['pgrep', '-f', f'openclaw.*{session_key}'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
-            return int(pids[0])
-        
+        pid = _pid_cache.get(session_key)
+        if pid is not None:
+            try:
+                os.kill(pid, 0)  # liveness check only, delivers nothing
+                return pid
+            except ProcessLookupError:
+                _pid_cache.pop(session_key, None)
+            except PermissionError:
+                return pid  # alive, just owned by another user
+
+        if proc_map is None:
+            proc_map = _get_pid_index(session_key)
+        pid = proc_map.get(session_key)
+        if pid is not None:
+            _pid_cache[session_key] = pid
+            return pid
+
         # Alternative: Check if there's a session file with PID info
-        session_file = Path(f"~/.openclaw/agents/main/sessions/{session_key.split(':')[-1]}.pid").expanduser()
-        if session_file.exists():
-            return int(session_file.read_text().strip())
-        
+        session_file = os.path.join(_PID_FILE_DIR, f"{session_key.split(':')[-1]}.pid")
+        if os.path.exists(session_file):
+            with open(session_file) as f:
+                pid = int(f.read().strip())
+            _pid_cache[session_key] = pid
+            return pid
+
         return None
     except Exception as e:
         logger.error(f"Error finding PID for {session_key}: {e}")
@@ -146,43 +397,153 @@ def get_agent_pid(session_key):
 
 
 def get_paused_agents():
-    """Get list of paused agents from control log."""
-    paused = set()
-    if not os.path.exists(CONTROL_LOG_FILE):
-        return paused
-    
+    """Get the set of paused agents, replaying only unseen control log entries."""
+    # The replay offset counts queued lines, so settle the buffer before
+    # comparing it against the on-disk size.
+    if _log_buffer:
+        _flush_control_log()
+    with _paused_state['lock']:
+        try:
+            size = os.path.getsize(CONTROL_LOG_FILE)
+        except OSError:
+            return set(_paused_state['set'])
+
+        if size < _paused_state['offset']:
+            # Log was truncated/rotated behind us - replay from the start
+            _paused_state['set'].clear()
+            _paused_state['offset'] = 0
+
+        if size > _paused_state['offset']:
+            try:
+                with open(CONTROL_LOG_FILE, 'rb') as f:
+                    f.seek(_paused_state['offset'])
+                    for line in f:
+                        try:
+                            _apply_control_entry(_loads(line))
+                        except ValueError:
+                            continue
+                    _paused_state['offset'] = f.tell()
+            except Exception as e:
+                logger.error(f"Error reading control log: {e}")
+
+        return set(_paused_state['set'])
+
+
+def get_recent_actions(n=50):
+    """Return the last n control log entries via a tail read instead of readlines()."""
+    actions = []
     try:
-        with open(CONTROL_LOG_FILE, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get('action') == 'pause' and entry.get('success'):
-                        paused.add(entry['session_key'])
-                    elif entry.get('action') == 'resume' and entry.get('success'):
-                        paused.discard(entry['session_key'])
-                    elif entry.get('action') == 'kill' and entry.get('success'):
-                        paused.discard(entry['session_key'])
-                except json.JSONDecodeError:
-                    continue
+        with open(CONTROL_LOG_FILE, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 16384))
+            data = f.read()
+        lines = data.split(b'\n')
+        if size > 16384:
+            # First line is likely cut mid-entry by the seek
+            lines = lines[1:]
+        for line in lines[-(n + 1):]:
+            if not line:
+                continue
+            try:
+                actions.append(_loads(line))
+            except ValueError:
+                continue
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.error(f"Error reading control log: {e}")
-    
-    return paused
+    return actions[-n:]
+
+
+# Ring of already-parsed recent actions: primed from the log tail at
+# startup, appended to on every log write, so status polls never touch
+# the file or re-parse JSON
+_recent_actions = deque(get_recent_actions(50), maxlen=50)
+
+
+def _load_control_state():
+    """Prime paused agents and recent actions from the last compaction snapshot."""
+    try:
+        with open(CONTROL_STATE_FILE, 'rb') as f:
+            snap = _loads(f.read())
+    except FileNotFoundError:
+        return
+    except (ValueError, IOError) as e:
+        logger.error(f"Error reading control state snapshot: {e}")
+        return
+    with _paused_state['lock']:
+        _paused_state['set'].update(snap.get('paused', []))
+    # Snapshot actions predate anything replayed from the truncated log
+    combined = list(snap.get('recent_actions', [])) + list(_recent_actions)
+    _recent_actions.clear()
+    _recent_actions.extend(combined[-_recent_actions.maxlen:])
 
 
-def send_signal_to_agent(session_key, signal_num, signal_name):
+_load_control_state()
+
+
+def _compact_control_log():
+    """Snapshot derived control state and shrink the log to bound replay cost."""
+    global _log_file
+    paused = get_paused_agents()
+    try:
+        with _log_lock:
+            snap = {
+                'timestamp': _iso_now(),
+                'paused': sorted(paused),
+                'recent_actions': list(_recent_actions),
+            }
+            tmp_file = f"{CONTROL_STATE_FILE}.tmp.{os.getpid()}"
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(snap))
+            os.replace(tmp_file, CONTROL_STATE_FILE)
+
+            # The data collector rebuilds its own paused set by replaying
+            # this log and never reads the snapshot, so the log can't be
+            # emptied: reseed it with one synthetic pause per currently
+            # paused session so external replays stay correct.
+            seed = b''.join(
+                _dumps({
+                    "timestamp": snap['timestamp'],
+                    "action": "pause",
+                    "session_key": key,
+                    "success": True,
+                    "details": {"compaction_seed": True}
+                }) + b'\n'
+                for key in snap['paused']
+            )
+            tmp_log = f"{CONTROL_LOG_FILE}.tmp.{os.getpid()}"
+            with open(tmp_log, 'wb') as f:
+                f.write(seed)
+                f.flush()
+                os.fsync(f.fileno())
+            if _log_file is not None:
+                _log_file.close()
+                _log_file = None
+            os.replace(tmp_log, CONTROL_LOG_FILE)
+        with _paused_state['lock']:
+            # The seed entries are already reflected in the in-memory set
+            _paused_state['offset'] = len(seed)
+        logger.info("Compacted control log into %s", CONTROL_STATE_FILE)
+    except Exception as e:
+        logger.error(f"Error compacting control log: {e}")
+
+
+def send_signal_to_agent(session_key, signal_num, signal_name, proc_map=None):
     """
     Send a signal to an agent process.
     Since agents run within openclaw-gateway, we use a signaling mechanism
     through the control log and attempt direct process signaling.
     """
-    pid = get_agent_pid(session_key)
+    pid = get_agent_pid(session_key, proc_map=proc_map)
     
     if pid:
         try:
             os.kill(pid, signal_num)
+            _pid_cache[session_key] = pid
             return True, f"Signal {signal_name} sent to PID {pid}"
         except ProcessLookupError:
+            _pid_cache.pop(session_key, None)
             return False, f"Process {pid} not found"
         except PermissionError:
             return False, f"Permission denied to signal process {pid}"
@@ -197,11 +558,11 @@ def send_signal_to_agent(session_key, signal_num, signal_name):
 @app.route('/api/control/pause', methods=['POST'])
 def pause_agent():
     """Pause an agent (SIGSTOP)."""
-    logger.info("POST /api/control/pause requested")
+    logger.debug("POST /api/control/pause requested")
     
     data = request.get_json()
     if not data or 'session_key' not in data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Missing session_key in request body"
         }), 400
@@ -211,7 +572,7 @@ def pause_agent():
     # Check if already paused
     paused = get_paused_agents()
     if session_key in paused:
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": f"Agent {session_key} is already paused",
             "paused": True
@@ -224,14 +585,14 @@ def pause_agent():
     log_control_action('pause', session_key, success, {"details": details})
     
     if success:
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": f"Agent {session_key} paused",
             "paused": True,
             "details": details
         }), 200
     else:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Failed to pause agent: {details}",
             "paused": False
@@ -241,11 +602,11 @@ def pause_agent():
 @app.route('/api/control/resume', methods=['POST'])
 def resume_agent():
     """Resume an agent (SIGCONT)."""
-    logger.info("POST /api/control/resume requested")
+    logger.debug("POST /api/control/resume requested")
     
     data = request.get_json()
     if not data or 'session_key' not in data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Missing session_key in request body"
         }), 400
@@ -255,7 +616,7 @@ def resume_agent():
     # Check if actually paused
     paused = get_paused_agents()
     if session_key not in paused:
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": f"Agent {session_key} was not paused",
             "paused": False
@@ -268,14 +629,14 @@ def resume_agent():
     log_control_action('resume', session_key, success, {"details": details})
     
     if success:
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": f"Agent {session_key} resumed",
             "paused": False,
             "details": details
         }), 200
     else:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Failed to resume agent: {details}",
             "paused": True
@@ -285,11 +646,11 @@ def resume_agent():
 @app.route('/api/control/kill', methods=['POST'])
 def kill_agent():
     """Kill an agent session."""
-    logger.info("POST /api/control/kill requested")
+    logger.debug("POST /api/control/kill requested")
     
     data = request.get_json()
     if not data or 'session_key' not in data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Missing session_key in request body"
         }), 400
@@ -299,7 +660,7 @@ def kill_agent():
     # Prevent killing protected sessions
     if session_key in PROTECTED_SESSIONS:
         log_control_action('kill', session_key, False, {"reason": "protected_session"})
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Cannot kill protected session: {session_key}",
             "protected": True
@@ -311,7 +672,7 @@ def kill_agent():
     if success_term:
         # Log the kill action
         log_control_action('kill', session_key, True, {"signal": "SIGTERM", "details": details_term})
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "message": f"Agent {session_key} terminated",
             "killed": True,
@@ -319,7 +680,7 @@ def kill_agent():
         }), 200
     else:
         log_control_action('kill', session_key, False, {"error": details_term})
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Failed to kill agent: {details_term}",
             "killed": False
@@ -329,7 +690,7 @@ def kill_agent():
 @app.route('/api/control/stop_all', methods=['POST'])
 def stop_all_agents():
     """Emergency stop all non-protected agents."""
-    logger.info("POST /api/control/stop_all requested")
+    logger.debug("POST /api/control/stop_all requested")
     
     results = []
     killed_count = 0
@@ -337,37 +698,82 @@ def stop_all_agents():
     # Read current state to get active sessions
     try:
         if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, 'r') as f:
-                state = json.load(f)
-                sessions = state.get('sessions', {}).get('active_sessions', [])
-                
-                for session in sessions:
-                    session_key = session.get('session_key')
-                    if not session_key or session_key in PROTECTED_SESSIONS:
-                        continue
-                    
-                    # Kill each agent
-                    success, details = send_signal_to_agent(session_key, signal.SIGTERM, "SIGTERM")
-                    log_control_action('kill', session_key, success, {
-                        "emergency_stop": True,
-                        "details": details
-                    })
-                    
-                    results.append({
-                        "session_key": session_key,
-                        "success": success,
-                        "details": details
-                    })
-                    if success:
-                        killed_count += 1
+            state, _ = load_state_file()
+            sessions = state.get('sessions', {}).get('active_sessions', [])
+
+            # Only the session keys matter here; pull them out and drop
+            # protected sessions before doing any per-agent work
+            targets = [key for key in (s.get('session_key') for s in sessions)
+                       if key and key not in PROTECTED_SESSIONS]
+
+            # Scan /proc once for the whole batch instead of once per agent
+            proc_map = _scan_proc_cmdlines()
+
+            def record(session_key, success, details):
+                nonlocal killed_count
+                log_control_action('kill', session_key, success, {
+                    "emergency_stop": True,
+                    "details": details
+                })
+                results.append({
+                    "session_key": session_key,
+                    "success": success,
+                    "details": details
+                })
+                if success:
+                    killed_count += 1
+
+            # Group sessions by process group so one killpg(2) replaces a
+            # kill per agent. A group sharing a pgid with a protected
+            # session (or with this server) falls back to per-PID kills.
+            protected_pgids = {os.getpgid(0)}
+            for key in PROTECTED_SESSIONS:
+                pid = get_agent_pid(key, proc_map=proc_map)
+                if pid is not None:
+                    try:
+                        protected_pgids.add(os.getpgid(pid))
+                    except OSError:
+                        pass
+
+            groups = {}
+            singles = []
+            for session_key in targets:
+                pid = get_agent_pid(session_key, proc_map=proc_map)
+                pgid = None
+                if pid is not None:
+                    try:
+                        pgid = os.getpgid(pid)
+                    except OSError:
+                        pgid = None
+                if pgid is not None and pgid not in protected_pgids:
+                    groups.setdefault(pgid, []).append(session_key)
+                else:
+                    singles.append(session_key)
+
+            for pgid, keys in groups.items():
+                if len(keys) == 1:
+                    singles.append(keys[0])
+                    continue
+                try:
+                    os.killpg(pgid, signal.SIGTERM)
+                    success, details = True, f"SIGTERM sent to process group {pgid}"
+                except Exception as e:
+                    success, details = False, f"Error signaling process group {pgid}: {str(e)}"
+                for session_key in keys:
+                    record(session_key, success, details)
+
+            for session_key in singles:
+                success, details = send_signal_to_agent(session_key, signal.SIGTERM, "SIGTERM",
+                                                        proc_map=proc_map)
+                record(session_key, success, details)
     except Exception as e:
         logger.error(f"Error in stop_all: {e}")
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Error during emergency stop: {str(e)}"
         }), 500
     
-    return jsonify({
+    return _json_response({
         "status": "ok",
         "message": f"Emergency stop completed. Killed {killed_count} agents.",
         "killed_count": killed_count,
@@ -375,22 +781,106 @@ def stop_all_agents():
     }), 200
 
 
-# Global auto mode flag
+def _control_many(action, signal_num, signal_name):
+    """
+    Shared implementation for the batch control endpoints: one /proc scan
+    and one buffered log write cover the whole list of sessions.
+    """
+    data = request.get_json()
+    session_keys = (data or {}).get('session_keys')
+    if not isinstance(session_keys, list) or not session_keys:
+        return _json_response({
+            "status": "error",
+            "message": "Missing session_keys list in request body"
+        }), 400
+
+    proc_map = _scan_proc_cmdlines()
+    paused = get_paused_agents() if action in ('pause', 'resume') else None
+
+    results = []
+    succeeded = 0
+    for session_key in session_keys:
+        if action == 'kill' and session_key in PROTECTED_SESSIONS:
+            log_control_action('kill', session_key, False, {"reason": "protected_session"})
+            results.append({
+                "session_key": session_key,
+                "success": False,
+                "details": f"Cannot kill protected session: {session_key}"
+            })
+            continue
+        if action == 'pause' and session_key in paused:
+            results.append({
+                "session_key": session_key,
+                "success": True,
+                "details": "already paused"
+            })
+            continue
+        if action == 'resume' and session_key not in paused:
+            results.append({
+                "session_key": session_key,
+                "success": True,
+                "details": "was not paused"
+            })
+            continue
+
+        success, details = send_signal_to_agent(session_key, signal_num, signal_name,
+                                                proc_map=proc_map)
+        log_control_action(action, session_key, success, {"details": details})
+        results.append({
+            "session_key": session_key,
+            "success": success,
+            "details": details
+        })
+        if success:
+            succeeded += 1
+
+    return _json_response({
+        "status": "ok",
+        "succeeded": succeeded,
+        "results": results
+    }), 200
+
+
+@app.route('/api/control/pause_many', methods=['POST'])
+def pause_many():
+    """Pause a batch of agents (SIGSTOP) in a single request."""
+    logger.debug("POST /api/control/pause_many requested")
+    return _control_many('pause', signal.SIGSTOP, "SIGSTOP")
+
+
+@app.route('/api/control/resume_many', methods=['POST'])
+def resume_many():
+    """Resume a batch of agents (SIGCONT) in a single request."""
+    logger.debug("POST /api/control/resume_many requested")
+    return _control_many('resume', signal.SIGCONT, "SIGCONT")
+
+
+@app.route('/api/control/kill_many', methods=['POST'])
+def kill_many():
+    """Kill a batch of agent sessions in a single request."""
+    logger.debug("POST /api/control/kill_many requested")
+    return _control_many('kill', signal.SIGTERM, "SIGTERM")
+
+
+# Global auto mode flag; guarded by a lock since gunicorn gthread workers
+# toggle and read it from multiple threads
 auto_mode_enabled = True
+_auto_mode_lock = threading.Lock()
 
 @app.route('/api/control/auto', methods=['POST'])
 def control_auto():
     """Enable or disable auto mode for agent assignment."""
     global auto_mode_enabled
-    logger.info("POST /api/control/auto requested")
-    
+    logger.debug("POST /api/control/auto requested")
+
     data = request.get_json() or {}
     enabled = data.get('enabled', True)
-    
-    auto_mode_enabled = bool(enabled)
+
+    with _auto_mode_lock:
+        auto_mode_enabled = bool(enabled)
     log_control_action('auto_mode', None, success=True, details={'enabled': auto_mode_enabled})
     
-    return jsonify({
+    return _json_response({
         "status": "ok",
         "auto_mode": auto_mode_enabled,
         "message": f"Auto mode {'enabled' if auto_mode_enabled else 'disabled'}"
@@ -400,26 +890,13 @@ def control_auto():
 def control_status():
     """Get control status - list of paused agents and recent control actions."""
     global auto_mode_enabled
-    logger.info("GET /api/control/status requested")
+    logger.debug("GET /api/control/status requested")
     
     paused = get_paused_agents()
-    recent_actions = []
-    
-    # Get recent control actions
-    if os.path.exists(CONTROL_LOG_FILE):
-        try:
-            with open(CONTROL_LOG_FILE, 'r') as f:
-                lines = f.readlines()
-                # Get last 50 actions
-                for line in lines[-50:]:
-                    try:
-                        recent_actions.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
-                        continue
-        except Exception as e:
-            logger.error(f"Error reading control log: {e}")
-    
-    return jsonify({
+    with _log_lock:
+        recent_actions = list(_recent_actions)
+
+    return _json_response({
         "status": "ok",
         "auto_mode": auto_mode_enabled,
         "paused_agents": list(paused),
@@ -432,23 +909,61 @@ def control_status():
 # KANBAN API ENDPOINTS
 # =============================================================================
 
+# Request-body validators, built once at import. fastjsonschema/pydantic
+# would compile these schemas ahead of time, but neither is a dependency
+# and for bodies this small a tuple-driven check is as fast as it gets.
+_CREATE_TASK_TYPES = (('title', str), ('description', str), ('priority', str),
+                      ('status', str), ('created_by', str), ('obsidian_link', str),
+                      ('category', str))
+_UPDATE_TASK_TYPES = (('title', str), ('description', str), ('priority', str))
+
+
+def _validate_types(data, field_types):
+    """Return an error message if any present field has the wrong type, else None."""
+    for field, expected in field_types:
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected):
+            return f"Field '{field}' must be a {expected.__name__}"
+    return None
+
+
+# Serialized board cache: the bytes are reused as long as kanban keeps
+# returning the same cached view object; the ETag is a digest of the
+# payload so it stays valid across restarts
+_board_cache = {'obj': None, 'bytes': None, 'etag': None}
+_board_lock = threading.Lock()
+
+
+def _bump_board_version():
+    """Invalidate the serialized board cache after a mutating endpoint."""
+    with _board_lock:
+        _board_cache['obj'] = None
+
+
 @app.route('/api/kanban', methods=['GET'])
 def get_kanban_board():
     """
     Get all tasks grouped by status column.
     Returns tasks organized by Kanban columns.
     """
-    logger.info("GET /api/kanban requested")
-    
+    logger.debug("GET /api/kanban requested")
+
     try:
         board_data = get_all_tasks_grouped()
-        return jsonify({
-            "status": "ok",
-            "data": board_data
-        }), 200
+        with _board_lock:
+            if board_data is not _board_cache['obj']:
+                payload = _dumps({"status": "ok", "data": board_data})
+                _board_cache['bytes'] = payload
+                _board_cache['obj'] = board_data
+                _board_cache['etag'] = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+            payload = _board_cache['bytes']
+            etag = _board_cache['etag']
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+        return app.response_class(payload, mimetype='application/json'), 200, {'ETag': etag}
     except Exception as e:
         logger.error(f"Error getting kanban board: {e}")
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Error loading kanban board: {str(e)}"
         }), 500
@@ -461,15 +976,22 @@ def create_kanban_task():
     Required: title
     Optional: description, priority (low/medium/high/critical), status
     """
-    logger.info("POST /api/kanban/tasks requested")
+    logger.debug("POST /api/kanban/tasks requested")
     
     data = request.get_json()
     if not data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Request body is required"
         }), 400
-    
+
+    error = _validate_types(data, _CREATE_TASK_TYPES)
+    if error:
+        return _json_response({
+            "status": "error",
+            "message": error
+        }), 400
+
     title = data.get('title', '').strip()
     description = data.get('description', '').strip()
     priority = data.get('priority', 'medium').lower()
@@ -489,13 +1011,14 @@ def create_kanban_task():
     )
     
     if success:
-        return jsonify({
+        _bump_board_version()
+        return _json_response({
             "status": "ok",
             "message": message,
             "task": task
         }), 201
     else:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": message
         }), 400
@@ -504,16 +1027,16 @@ def create_kanban_task():
 @app.route('/api/kanban/tasks/<task_id>', methods=['GET'])
 def get_kanban_task(task_id):
     """Get a single task by ID."""
-    logger.info(f"GET /api/kanban/tasks/{task_id} requested")
+    logger.debug("GET /api/kanban/tasks/%s requested", task_id)
     
     task = get_task(task_id)
     if task:
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "task": task
         }), 200
     else:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Task {task_id} not found"
         }), 404
@@ -525,15 +1048,22 @@ def update_kanban_task(task_id):
     Update a task.
     Can update: title, description, priority
     """
-    logger.info(f"PUT /api/kanban/tasks/{task_id} requested")
+    logger.debug("PUT /api/kanban/tasks/%s requested", task_id)
     
     data = request.get_json()
     if not data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Request body is required"
         }), 400
     
+    error = _validate_types(data, _UPDATE_TASK_TYPES)
+    if error:
+        return _json_response({
+            "status": "error",
+            "message": error
+        }), 400
+
     # Build updates dict from allowed fields
     updates = {}
     for field in ['title', 'description', 'priority']:
@@ -541,27 +1071,28 @@ def update_kanban_task(task_id):
             updates[field] = data[field]
     
     if not updates:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "No valid fields to update. Allowed: title, description, priority"
         }), 400
     
     success, task, message = update_task(task_id, **updates)
-    
+
     if success:
-        return jsonify({
+        _bump_board_version()
+        return _json_response({
             "status": "ok",
             "message": message,
             "task": task
         }), 200
     else:
         if "not found" in message.lower():
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 404
         else:
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 400
@@ -573,21 +1104,28 @@ def move_kanban_task(task_id):
     Move a task to a new column/status.
     Auto-assigns agent when moving to 'In Progress'.
     """
-    logger.info(f"PUT /api/kanban/tasks/{task_id}/move requested")
+    logger.debug("PUT /api/kanban/tasks/%s/move requested", task_id)
     
     data = request.get_json()
     if not data or 'status' not in data:
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": "Missing 'status' field in request body"
         }), 400
     
+    if not isinstance(data['status'], str):
+        return _json_response({
+            "status": "error",
+            "message": "Field 'status' must be a str"
+        }), 400
+
     new_status = data['status']
     auto_assign = data.get('auto_assign', True)
     
     success, task, message = move_task(task_id, new_status, auto_assign=auto_assign)
-    
+
     if success:
+        _bump_board_version()
         response = {
             "status": "ok",
             "message": message,
@@ -597,15 +1135,15 @@ def move_kanban_task(task_id):
         if task.get('assigned_agent'):
             response['assigned_agent'] = task['assigned_agent']
             response['session_key'] = task.get('session_key')
-        return jsonify(response), 200
+        return _json_response(response), 200
     else:
         if "not found" in message.lower():
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 404
         else:
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 400
@@ -614,23 +1152,24 @@ def move_kanban_task(task_id):
 @app.route('/api/kanban/tasks/<task_id>', methods=['DELETE'])
 def delete_kanban_task(task_id):
     """Delete a task."""
-    logger.info(f"DELETE /api/kanban/tasks/{task_id} requested")
+    logger.debug("DELETE /api/kanban/tasks/%s requested", task_id)
     
     success, message = delete_task(task_id)
-    
+
     if success:
-        return jsonify({
+        _bump_board_version()
+        return _json_response({
             "status": "ok",
             "message": message
         }), 200
     else:
         if "not found" in message.lower():
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 404
         else:
-            return jsonify({
+            return _json_response({
                 "status": "error",
                 "message": message
             }), 500
@@ -639,14 +1178,14 @@ def delete_kanban_task(task_id):
 @app.route('/api/kanban/assignments', methods=['GET'])
 def get_kanban_assignments():
     """Get agent assignment history."""
-    logger.info("GET /api/kanban/assignments requested")
+    logger.debug("GET /api/kanban/assignments requested")
     
     task_id = request.args.get('task_id')
     limit = request.args.get('limit', 100, type=int)
     
     try:
         history = get_assignment_history(task_id=task_id, limit=limit)
-        return jsonify({
+        return _json_response({
             "status": "ok",
             "data": {
                 "assignments": history,
@@ -655,23 +1194,29 @@ def get_kanban_assignments():
         }), 200
     except Exception as e:
         logger.error(f"Error getting assignment history: {e}")
-        return jsonify({
+        return _json_response({
             "status": "error",
             "message": f"Error loading assignment history: {str(e)}"
         }), 500
 
 
+# The column list never changes at runtime; serialize it once at import
+_COLUMNS_PAYLOAD = _dumps({
+    "status": "ok",
+    "data": {
+        "columns": KANBAN_COLUMNS
+    }
+})
+
+
 @app.route('/api/kanban/columns', methods=['GET'])
 def get_kanban_columns():
     """Get list of valid Kanban columns."""
-    logger.info("GET /api/kanban/columns requested")
-    
-    return jsonify({
-        "status": "ok",
-        "data": {
-            "columns": KANBAN_COLUMNS
-        }
-    }), 200
+    logger.debug("GET /api/kanban/columns requested")
+
+    return app.response_class(_COLUMNS_PAYLOAD, mimetype='application/json'), 200, {
+        'Cache-Control': 'public, max-age=86400, immutable'
+    }
 
 
 # =============================================================================
@@ -682,7 +1227,7 @@ def get_kanban_columns():
 def not_found(error):
     """Handle 404 errors."""
     logger.warning(f"404 error: {error}")
-    return jsonify({
+    return _json_response({
         "status": "error",
         "message": "Endpoint not found"
     }), 404
@@ -692,7 +1237,7 @@ def not_found(error):
 def internal_error(error):
     """Handle 500 errors."""
     logger.error(f"500 error: {error}")
-    return jsonify({
+    return _json_response({
         "status": "error",
         "message": "Internal server error"
     }), 500
@@ -709,5 +1254,7 @@ if __name__ == '__main__':
     os.makedirs(app.static_folder, exist_ok=True)
     os.makedirs(app.template_folder, exist_ok=True)
     os.makedirs(os.path.dirname(CONTROL_LOG_FILE), exist_ok=True)
-    
-    app.run(host=HOST, port=PORT, debug=False, use_reloader=False)
+
+    # Dev entry point; production runs under gunicorn via wsgi.py.
+    # threaded=True so one slow control action doesn't block every poll.
+    app.run(host=HOST, port=PORT, debug=False, use_reloader=False, threaded=True)
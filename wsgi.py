@@ -0,0 +1,22 @@
+"""
+WSGI entry point for running the dashboard under gunicorn.
+
+The server keeps its hot state (paused agents, control-log buffer,
+response caches) in process memory, so run a single worker with threads:
+
+    gunicorn -k gthread -w 1 --threads 8 -b 0.0.0.0:5000 wsgi:application
+
+The endpoints are I/O-bound (file reads, /proc scans, signal syscalls),
+so threads give real concurrency where the Werkzeug dev server serialized
+every request.
+"""
+
+import os
+
+from server import app, STATE_FILE, CONTROL_LOG_FILE
+
+# Same directory setup the dev entry point performs
+os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+os.makedirs(os.path.dirname(CONTROL_LOG_FILE), exist_ok=True)
+
+application = app